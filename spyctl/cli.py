@@ -90,7 +90,13 @@ def notice(notice_msg):
     input()
 
 
-class CustomDumper(yaml.SafeDumper):
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+YAML_BASE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# libyaml requires an integer width, float("inf") is rejected
+YAML_MAX_WIDTH = 2**31 - 1
+
+
+class FlowMatchRepresenter:
     def represent_mapping(self, tag, mapping, flow_style=None):
         # Flow style for the
         if mapping and lib.KEY_FIELD in mapping and lib.OPERATOR_FIELD in mapping:
@@ -98,8 +104,19 @@ class CustomDumper(yaml.SafeDumper):
         return super().represent_mapping(tag, mapping, flow_style)
 
 
+class CustomDumper(FlowMatchRepresenter, yaml.SafeDumper):
+    pass
+
+
+class CustomCDumper(FlowMatchRepresenter, YAML_BASE_DUMPER):
+    pass
+
+
 def make_yaml(obj) -> str:
-    return yaml.dump(obj, sort_keys=False, width=float("inf"), Dumper=CustomDumper)
+    # libyaml drops the "..." document end marker after a bare scalar, so
+    # only collections go through it
+    dumper = CustomCDumper if isinstance(obj, (dict, list)) else CustomDumper
+    return yaml.dump(obj, sort_keys=False, width=YAML_MAX_WIDTH, Dumper=dumper)
 
 
 def show(
@@ -133,10 +150,7 @@ def show(
     elif output in [lib.OUTPUT_JSON, lib.OUTPUT_NDJSON]:
         if ndjson or output == lib.OUTPUT_NDJSON:
             if _seq_but_not_str(obj):
-                out_data = []
-                for item in obj:
-                    out_data.append(json.dumps(item))
-                out_data = "\n".join(out_data)
+                out_data = "\n".join(map(json.dumps, obj))
             else:
                 out_data = json.dumps(obj)
         else:
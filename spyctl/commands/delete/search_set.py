@@ -1,7 +1,5 @@
 """Handles the deletion of search sets."""
 
-import json
-
 import click
 
 import spyctl.commands.delete.shared_options as _so
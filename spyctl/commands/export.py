@@ -41,7 +41,7 @@ from spyctl.api.policies import get_policies
     "-o",
     "--output",
     default=lib.OUTPUT_YAML,
-    type=click.Choice(lib.OUTPUT_CHOICES + [lib.OUTPUT_WIDE], case_sensitive=False),
+    type=click.Choice(lib.OUTPUT_CHOICES + (lib.OUTPUT_WIDE,), case_sensitive=False),
     required=False,
 )
 def export(
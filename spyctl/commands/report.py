@@ -55,7 +55,7 @@ def generate(from_file: IO[str], save_input: str):
     "-o",
     "--output",
     default=lib.OUTPUT_DEFAULT,
-    type=click.Choice(lib.OUTPUT_CHOICES + [lib.OUTPUT_WIDE], case_sensitive=False),
+    type=click.Choice(lib.OUTPUT_CHOICES + (lib.OUTPUT_WIDE,), case_sensitive=False),
 )
 @click.argument("report_id", required=True)
 def status(report_id: str, output: str):
@@ -96,7 +96,7 @@ def delete(report_id: str):
     "-o",
     "--output",
     default=lib.OUTPUT_DEFAULT,
-    type=click.Choice(lib.OUTPUT_CHOICES + [lib.OUTPUT_WIDE], case_sensitive=False),
+    type=click.Choice(lib.OUTPUT_CHOICES + (lib.OUTPUT_WIDE,), case_sensitive=False),
 )
 def report_list(output: str):
     """Get the list of generated reports with status and metadata"""
@@ -14,7 +14,9 @@ from spyctl import spyctl
 from spyctl.config import configs, secrets
 from spyctl.config.configs import Context
 from spyctl.merge_lib.ruleset_merge_object import RulesetPolicyMergeObject
-from spyctl.tests.backups import backup_context, restore_context
+
+# Backs up and restores ~/.spyctl, so run on the single serial worker
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("spyctl_context_sandbox")]
 
 
 def test_merge_ruleset_policy(cluster_policy, rulesets, deviation, updated_ruleset):
@@ -118,14 +120,11 @@ def setup_module():
     def get_api_data():
         return "test_org", "test_key", "test_url"
 
-    restore_context()  # In case the last test was cancelled
-    backup_context()
     mock_ctx = mock.Mock()
     mock_ctx.get_api_data = mock.Mock()
     mock_ctx.get_api_data = get_api_data
     secrets.set_api_call()
+    # Load the config first, otherwise the CLI loads it mid-test and
+    # replaces the mock context
+    configs.load_config(silent=True)
     configs.set_current_context(mock_ctx)
-
-
-def teardown_module():
-    restore_context()
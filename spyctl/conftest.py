@@ -0,0 +1,38 @@
+"""Fixtures shared by every spyctl test package"""
+
+import pytest
+
+from spyctl.tests.backups import (
+    backup_secrets,
+    current_context,
+    restore_secrets,
+    use_context,
+)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Group tests for --dist=loadgroup. Tests marked serial share one
+    group, so a single xdist worker runs them one after another. Every
+    other module is its own group, as with --dist=loadscope."""
+    for item in items:
+        if item.get_closest_marker("xdist_group"):
+            continue
+        if item.get_closest_marker("serial"):
+            group = "serial"
+        else:
+            group = item.nodeid.split("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+@pytest.fixture(scope="session")
+def spyctl_context_sandbox():
+    """Back up the secrets file and current context once per session (so
+    once per xdist worker) and put them back when the session ends."""
+    restore_secrets()  # In case the last run was cancelled
+    context = current_context()
+    backup_secrets()
+    yield
+    restore_secrets()
+    if context:
+        use_context(context)
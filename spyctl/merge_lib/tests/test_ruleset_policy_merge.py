@@ -12,7 +12,9 @@ import spyctl.merge_lib.ruleset_merge_object as _rmo
 import spyctl.schemas_v2 as schemas
 import spyctl.spyctl_lib as lib
 from spyctl.config import configs, secrets
-from spyctl.tests.backups import backup_context, restore_context
+
+# Backs up and restores ~/.spyctl, so run on the single serial worker
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("spyctl_context_sandbox")]
 
 
 def test_default_deny_merge(
@@ -548,14 +550,8 @@ def setup_module():
     def get_api_data():
         return "test_org", "test_key", "test_url"
 
-    restore_context()  # In case the last test was cancelled
-    backup_context()
     mock_ctx = mock.Mock()
     mock_ctx.get_api_data = mock.Mock()
     mock_ctx.get_api_data = get_api_data
     secrets.set_api_call()
     configs.set_current_context(mock_ctx)
-
-
-def teardown_module():
-    restore_context()
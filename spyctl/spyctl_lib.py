@@ -1,4 +1,5 @@
 import copy
+import functools
 import hashlib
 import inspect
 import io
@@ -8,20 +9,18 @@ import os
 import re
 import sys
 import time
+import types
 import unicodedata
 from base64 import urlsafe_b64encode as b64url
 from dataclasses import dataclass
-from datetime import timezone
+from datetime import datetime, timedelta, timezone
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
-from uuid import uuid4
 
 import click
-import dateutil.parser as dateparser
 import yaml
-import zulu
 from click.shell_completion import CompletionItem
 from click_aliases import ClickAliasedGroup
 
@@ -1186,20 +1185,22 @@ NOTIF_TYPE_ALL = "all"
 NOTIF_TYPE_OBJECT = "object"
 NOTIF_TYPE_METRICS = "metrics"
 NOTIF_TYPE_DASHBOARD = "dashboard"
-NOTIF_TYPES = [
+NOTIF_TYPES = (
     NOTIF_TYPE_ALL,
     NOTIF_TYPE_OBJECT,
     NOTIF_TYPE_METRICS,
     NOTIF_TYPE_DASHBOARD,
-]
+)
 NOTIF_TYPE_FIELD = "type"
-NOTIF_TMPL_TYPES = ["agent-health", "security", "operations", "guardian"]
-NOTIF_TMPL_MAP = {
-    "agent-health": "agent_health",
-    "security": "security",
-    "operations": "operations",
-    "guardian": "guardian",
-}
+NOTIF_TMPL_TYPES = ("agent-health", "security", "operations", "guardian")
+NOTIF_TMPL_MAP = types.MappingProxyType(
+    {
+        "agent-health": "agent_health",
+        "security": "security",
+        "operations": "operations",
+        "guardian": "guardian",
+    }
+)
 DST_TYPE_ORG = "org_uid"
 DST_TYPE_EMAIL = "emails"
 DST_TYPE_SLACK = "slack"
@@ -1210,36 +1211,42 @@ DST_NAME_EMAIL = "Email"
 DST_NAME_SLACK = "Slack"
 DST_NAME_SNS = "SNS"
 DST_NAME_WEBHOOK = "Webhook"
-DST_TYPES = [
+DST_TYPES = (
     DST_TYPE_EMAIL,
     DST_TYPE_SLACK,
     DST_TYPE_SNS,
     DST_TYPE_WEBHOOK,
-]
-DST_NAMES = [
+)
+DST_NAMES = (
     DST_NAME_EMAIL,
     DST_NAME_SLACK,
     DST_NAME_SNS,
     DST_NAME_WEBHOOK,
-]
-DST_NAME_TO_TYPE = {
-    DST_NAME_EMAIL: DST_TYPE_EMAIL,
-    DST_NAME_SLACK: DST_TYPE_SLACK,
-    DST_NAME_SNS: DST_TYPE_SNS,
-    DST_NAME_WEBHOOK: DST_TYPE_WEBHOOK,
-}
-DST_TYPE_TO_NAME = {
-    DST_TYPE_EMAIL: DST_NAME_EMAIL,
-    DST_TYPE_SLACK: DST_NAME_SLACK,
-    DST_TYPE_SNS: DST_NAME_SNS,
-    DST_TYPE_WEBHOOK: DST_NAME_WEBHOOK,
-}
-DST_TYPE_TO_DESC = {
-    DST_TYPE_EMAIL: "A list of email addresses to send notifications to.",
-    DST_TYPE_SLACK: "A Slack hook URL to send notifications to.",
-    DST_TYPE_SNS: "An AWS sns endpoint to send notifications to.",
-    DST_TYPE_WEBHOOK: "A generic webhook URL to send notifications to.",
-}
+)
+DST_NAME_TO_TYPE = types.MappingProxyType(
+    {
+        DST_NAME_EMAIL: DST_TYPE_EMAIL,
+        DST_NAME_SLACK: DST_TYPE_SLACK,
+        DST_NAME_SNS: DST_TYPE_SNS,
+        DST_NAME_WEBHOOK: DST_TYPE_WEBHOOK,
+    }
+)
+DST_TYPE_TO_NAME = types.MappingProxyType(
+    {
+        DST_TYPE_EMAIL: DST_NAME_EMAIL,
+        DST_TYPE_SLACK: DST_NAME_SLACK,
+        DST_TYPE_SNS: DST_NAME_SNS,
+        DST_TYPE_WEBHOOK: DST_NAME_WEBHOOK,
+    }
+)
+DST_TYPE_TO_DESC = types.MappingProxyType(
+    {
+        DST_TYPE_EMAIL: "A list of email addresses to send notifications to.",
+        DST_TYPE_SLACK: "A Slack hook URL to send notifications to.",
+        DST_TYPE_SNS: "An AWS sns endpoint to send notifications to.",
+        DST_TYPE_WEBHOOK: "A generic webhook URL to send notifications to.",
+    }
+)
 ROUTES_FIELD = "routes"
 TARGETS_FIELD = "targets"
 TGT_WEBHOOK_URL = "url"
@@ -1284,12 +1291,12 @@ TGT_TYPE_EMAIL = "email"
 TGT_TYPE_SLACK = "slack"
 TGT_TYPE_PAGERDUTY = "pagerduty"
 TGT_TYPE_WEBHOOK = "webhook"
-TGT_TYPES = [
+TGT_TYPES = (
     TGT_TYPE_EMAIL,
     TGT_TYPE_SLACK,
     TGT_TYPE_PAGERDUTY,
     TGT_TYPE_WEBHOOK,
-]
+)
 TMPL_TYPE_EMAIL = TGT_TYPE_EMAIL
 TMPL_TYPE_SLACK = TGT_TYPE_SLACK
 TMPL_TYPE_PD = TGT_TYPE_PAGERDUTY
@@ -1332,7 +1339,7 @@ def get_dst_type(name):
 
 
 def get_dst_name(type):
-    return DST_NAME_TO_TYPE[type]
+    return DST_TYPE_TO_NAME[type]
 
 
 # Flags
@@ -1347,7 +1354,7 @@ OUTPUT_RAW = "raw"
 OUTPUT_WIDE = "wide"
 # used internally when updating objects directly via the API
 OUTPUT_API = "api"
-OUTPUT_CHOICES = [OUTPUT_YAML, OUTPUT_JSON, OUTPUT_NDJSON, OUTPUT_DEFAULT]
+OUTPUT_CHOICES = (OUTPUT_YAML, OUTPUT_JSON, OUTPUT_NDJSON, OUTPUT_DEFAULT)
 OUTPUT_DEST_DEFAULT = "default"  # stdout
 OUTPUT_DEST_FILE = "file"
 OUTPUT_DEST_API = "api"
@@ -1458,14 +1465,12 @@ def walk_up_tree(
     rv = []
     if cwd is None:
         cwd = Path.cwd()
-    config_path = Path.joinpath(cwd, local_path)
-    if Path.is_file(config_path):
-        conf = load_file(config_path)
-        if conf is not None:
-            rv.append((config_path, conf))
-    for parent in cwd.parents:
-        config_path = Path.joinpath(parent, local_path)
-        if Path.is_file(config_path):
+    local_str = str(local_path)
+    # Probe with plain strings, only build a Path for files that exist
+    for directory in (cwd, *cwd.parents):
+        config_str = os.path.join(directory, local_str)
+        if os.path.isfile(config_str):
+            config_path = Path(config_str)
             conf = load_file(config_path)
             if conf is not None:
                 rv.append((config_path, conf))
@@ -1478,39 +1483,57 @@ def walk_up_tree(
 
 def load_file(path: Path):
     try:
-        with path.open("r") as f:
-            try:
-                file_data = yaml.load(f, yaml.Loader)
-            except Exception:
-                try:
-                    file_data = json.load(f)
-                except Exception:
-                    try_log(
-                        f"Unable to load file at {path!s}. Is it valid yaml or json?"
-                    )
-                return None
+        raw_data = path.read_text()
+    except UnicodeDecodeError:
+        try_log(f"Unable to load file at {path!s}. Is it valid yaml or json?")
+        return None
     except IOError:
         try_log(f"Unable to read file at {path!s}. Check permissions.")
-    return file_data
+        return None
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        parsers = [__parse_json]
+    elif suffix in (".yaml", ".yml"):
+        parsers = [__parse_yaml]
+    else:
+        # Try json first, it is far cheaper to reject than yaml
+        parsers = [__parse_json, __parse_yaml]
+    for parser in parsers:
+        try:
+            return parser(raw_data)
+        except Exception:
+            continue
+    try_log(f"Unable to load file at {path!s}. Is it valid yaml or json?")
+    return None
+
+
+def __parse_json(raw_data: str):
+    return json.loads(raw_data)
+
+
+def __parse_yaml(raw_data: str):
+    return yaml.load(raw_data, yaml.Loader)
 
 
 class CustomGroup(click.Group):
     SECTION_BASIC = "Basic Commands"
     SECTION_ALERT_MGMT = "Alert Management"
     SECTION_OTHER = "Other Commands"
-    command_sections = [SECTION_BASIC, SECTION_ALERT_MGMT, SECTION_OTHER]
-    cmd_to_section_map = {
-        "apply": SECTION_BASIC,
-        "create": SECTION_BASIC,
-        "close": SECTION_ALERT_MGMT,
-        "delete": SECTION_BASIC,
-        "diff": SECTION_BASIC,
-        "get": SECTION_BASIC,
-        "merge": SECTION_BASIC,
-        "snooze": SECTION_ALERT_MGMT,
-        "suppress": SECTION_ALERT_MGMT,
-        "validate": SECTION_BASIC,
-    }
+    command_sections = (SECTION_BASIC, SECTION_ALERT_MGMT, SECTION_OTHER)
+    cmd_to_section_map = types.MappingProxyType(
+        {
+            "apply": SECTION_BASIC,
+            "create": SECTION_BASIC,
+            "close": SECTION_ALERT_MGMT,
+            "delete": SECTION_BASIC,
+            "diff": SECTION_BASIC,
+            "get": SECTION_BASIC,
+            "merge": SECTION_BASIC,
+            "snooze": SECTION_ALERT_MGMT,
+            "suppress": SECTION_ALERT_MGMT,
+            "validate": SECTION_BASIC,
+        }
+    )
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         self.format_help_text(ctx, formatter)
@@ -1546,6 +1569,7 @@ class CustomGroup(click.Group):
         self, ctx: click.Context, formatter: click.HelpFormatter
     ) -> None:
         commands = []
+        max_len = 0
         for subcommand in self.list_commands(ctx):
             cmd = self.get_command(ctx, subcommand)
             # What is this, the tool lied about a command.  Ignore it
@@ -1555,18 +1579,19 @@ class CustomGroup(click.Group):
                 continue
 
             commands.append((subcommand, cmd))
+            max_len = max(max_len, len(subcommand))
 
         # allow for 3 times the default spacing
         if len(commands):
-            limit = formatter.width - 6 - max(len(cmd[0]) for cmd in commands)
+            limit = formatter.width - 6 - max_len
 
-            sections: Dict[str, List] = {}
-            for section_title in self.command_sections:
-                sections.setdefault(section_title, [])
+            sections: Dict[str, List] = {
+                section_title: [] for section_title in self.command_sections
+            }
             for subcommand, cmd in commands:
-                section_title = self.cmd_to_section_map.get(subcommand)
-                if not section_title:
-                    section_title = self.SECTION_OTHER
+                section_title = self.cmd_to_section_map.get(
+                    subcommand, self.SECTION_OTHER
+                )
                 help = cmd.get_short_help_str(limit)
                 sections[section_title].append((subcommand, help))
 
@@ -1756,21 +1781,23 @@ class ArgumentParametersCommand(CustomCommand):
 
 class MutuallyExclusiveOption(click.Option):
     def __init__(self, *args, **kwargs):
-        self.mutually_exclusive = set(kwargs.pop("mutually_exclusive", []))
+        mutually_exclusive = kwargs.pop("mutually_exclusive", ())
+        self.mutually_exclusive = frozenset(mutually_exclusive)
+        # Joined once, in the order given, for the help and error text
+        self.mutually_exclusive_str = ", ".join(mutually_exclusive)
         help = kwargs.get("help", "")
         if self.mutually_exclusive:
-            ex_str = ", ".join(self.mutually_exclusive)
             kwargs["help"] = help + (
                 " This argument is mutually exclusive with "
-                " arguments: [" + ex_str + "]."
+                " arguments: [" + self.mutually_exclusive_str + "]."
             )
         super(MutuallyExclusiveOption, self).__init__(*args, **kwargs)
 
     def handle_parse_result(self, ctx, opts, args):
-        if self.mutually_exclusive.intersection(opts) and self.name in opts:
+        if self.name in opts and not self.mutually_exclusive.isdisjoint(opts):
             raise click.UsageError(
                 f"Illegal usage: `{self.name}` is mutually exclusive with "
-                f"arguments `{', '.join(self.mutually_exclusive)}`."
+                f"arguments `{self.mutually_exclusive_str}`."
             )
         return super(MutuallyExclusiveOption, self).handle_parse_result(ctx, opts, args)
 
@@ -1820,35 +1847,24 @@ class OptionEatAll(click.Option):
 
 
 class MutuallyExclusiveEatAll(MutuallyExclusiveOption, OptionEatAll):
-    def __init__(self, *args, **kwargs):
-        self.mutually_exclusive = set(kwargs.pop("mutually_exclusive", []))
-        help = kwargs.get("help", "")
-        if self.mutually_exclusive:
-            ex_str = ", ".join(self.mutually_exclusive)
-            kwargs["help"] = help + (
-                " This argument is mutually exclusive with "
-                " arguments: [" + ex_str + "]."
-            )
-        self.save_other_options = kwargs.pop("save_other_options", True)
-        nargs = kwargs.pop("nargs", -1)
-        assert nargs == -1, "nargs, if set, must be -1 not {}".format(nargs)
-        self._previous_parser_process = None
-        self._eat_all_parser = None
-        super(MutuallyExclusiveEatAll, self).__init__(*args, **kwargs)
+    # MutuallyExclusiveOption.__init__ chains into OptionEatAll.__init__
+    # through the MRO, so both sets of kwargs are consumed there.
+    pass
 
 
 def try_log(*args, **kwargs):
     global LOG_VAR
     try:
         if kwargs.pop(WARNING_MSG, False):
-            msg = f"{WARNING_COLOR}{' '.join(args)}{COLOR_END}"
+            text = args[0] if len(args) == 1 else " ".join(args)
+            msg = f"{WARNING_COLOR}{text}{COLOR_END}"
             if USE_LOG_VARS:
                 LOG_VAR.append(msg)
             print(msg, **kwargs, file=sys.stderr)
         else:
-            msg = " ".join(args)
+            # Only build the joined message when it is being captured
             if USE_LOG_VARS:
-                LOG_VAR.append(msg)
+                LOG_VAR.append(args[0] if len(args) == 1 else " ".join(args))
             print(*args, **kwargs, file=sys.stderr)
         sys.stderr.flush()
     except BrokenPipeError:
@@ -1872,25 +1888,39 @@ def api_log(*args, **kwargs):
         err_exit("Broken Pipe")
 
 
+TIME_SUFFIX_TO_SECONDS = {
+    "s": 1,
+    "sc": 1,
+    "m": 60,
+    "mn": 60,
+    "h": 60 * 60,
+    "hr": 60 * 60,
+    "d": 60 * 60 * 24,
+    "dy": 60 * 60 * 24,
+    "w": 60 * 60 * 24 * 7,
+    "wk": 60 * 60 * 24 * 7,
+}
+
+
 def time_inp(time_str: str, cap_one_day=False) -> Optional[int]:
     if time_str is None:
         return None
+    # Imported lazily, dateutil is only needed for this function
+    import dateutil.parser as dateparser
+
     past_seconds = 0
     epoch_time = None
     try:
         try:
             epoch_time = int(time_str)
         except ValueError:
-            if time_str.endswith(("s", "sc")):
-                past_seconds = float(time_str.split("s")[0])
-            elif time_str.endswith(("m", "mn")):
-                past_seconds = float(time_str.split("m")[0]) * 60
-            elif time_str.endswith(("h", "hr")):
-                past_seconds = float(time_str.split("h")[0]) * 60 * 60
-            elif time_str.endswith(("d", "dy")):
-                past_seconds = float(time_str.split("d")[0]) * 60 * 60 * 24
-            elif time_str.endswith(("w", "wk")):
-                past_seconds = float(time_str.split("w")[0]) * 60 * 60 * 24 * 7
+            # Split off the trailing alphabetic suffix (e.g. "15m" -> "m")
+            i = len(time_str)
+            while i > 0 and time_str[i - 1].isalpha():
+                i -= 1
+            multiplier = TIME_SUFFIX_TO_SECONDS.get(time_str[i:])
+            if multiplier:
+                past_seconds = float(time_str[:i]) * multiplier
             else:
                 date = dateparser.parse(time_str)
                 date = date.replace(tzinfo=date.tzinfo or timezone.utc)
@@ -1948,109 +1978,125 @@ def selectors_to_filters(resource: Dict, **filters) -> Dict:
     return rv
 
 
-def label_input_to_dict(input: Union[str, List[str], Dict]) -> Optional[Dict]:
+# Splits label input on commas not in parenthesis
+LABEL_SET_SPLIT_RE = re.compile(r",(?![^(]*\))")
+
+
+def __parse_label_str(inp: str) -> Optional[Dict]:
     in_str = " in "
     notin_str = " notin "
 
-    def parse_str_input(inp: str) -> Optional[Dict]:
-        def parse_only_key(key_inp: str) -> Optional[Dict]:
-            key_inp = key_inp.strip(" ")
-            if " " in key_inp:
-                return None
-            return {key_inp: "*"}
+    def parse_only_key(key_inp: str) -> Optional[Dict]:
+        key_inp = key_inp.strip(" ")
+        if " " in key_inp:
+            return None
+        return {key_inp: "*"}
+
+    def parse_equality_based(eq_inp: str) -> Optional[Dict]:
+        rv = {}
+        kv_pairs = eq_inp.split(",")
+        for pair in kv_pairs:
+            k, sep, v = pair.partition("=")
+            if sep:
+                # Values may legitimately contain further "=" characters
+                rv[k.strip()] = v.strip()
+            else:
+                only_key = parse_only_key(pair)
+                if not only_key:
+                    try_log(
+                        f"{pair} is an invalid format. Use 'key=value' or only 'key'",
+                        is_warning=True,
+                    )
+                    return None
+                rv.update(only_key)
+        if not rv:
+            return None
+        return rv
 
-        def parse_equality_based(eq_inp: str) -> Optional[Dict]:
-            rv = {}
-            kv_pairs = eq_inp.split(",")
-            for pair in kv_pairs:
+    def parse_set_based(set_inp) -> Optional[Dict]:
+        rv = {}
+        for set_str in LABEL_SET_SPLIT_RE.split(set_inp):
+            if in_str in set_str:
                 try:
-                    k, v = pair.split("=")
-                    k = k.strip(" ")
-                    v = v.strip(" ")
-                    rv[k] = v
-                except Exception:
-                    only_key = parse_only_key(pair)
-                    if not only_key:
-                        try_log(
-                            f"{pair} is an invalid format. Use 'key=value' or"
-                            " only 'key'",
-                            is_warning=True,
-                        )
-                        return None
-                    rv.update(only_key)
-            if not rv:
-                return None
-            return rv
-
-        def parse_set_based(set_inp) -> Optional[Dict]:
-            rv = {}
-            import re
-
-            # split input on commas not in parenthesis
-            pat = re.compile(r",(?![^(]*\))")
-            for set_str in re.split(pat, set_inp):
-                if in_str in set_str:
-                    try:
-                        k, s = set_str.split(in_str)
-                        s = s.replace("(", "").replace(")", "").split(",")
-                        s = [value.strip(" ") for value in s if value.strip(" ")]
-                        if not s:
-                            try_log(
-                                f"{set_str} cannot contain an empty",
-                                is_warning=True,
-                            )
-                            return None
-                        if len(s) == 1:
-                            s = s[0]
-                        rv[k] = s
-                    except Exception:
+                    k, s = set_str.split(in_str)
+                    s = s.replace("(", "").replace(")", "").split(",")
+                    s = [value.strip(" ") for value in s if value.strip(" ")]
+                    if not s:
                         try_log(
-                            f"{set_str} is an invalid format use 'key in"
-                            " (value1,value2)' or only 'key'",
+                            f"{set_str} cannot contain an empty",
                             is_warning=True,
                         )
                         return None
-                else:
-                    only_key = parse_only_key(set_str)
-                    if not only_key:
-                        try_log(
-                            f"{set_str} is an invalid format use 'key in"
-                            " (value1,value2)' or only 'key'",
-                            is_warning=True,
-                        )
-                        return None
-                    rv.update(only_key)
-            if not rv:
-                return None
-            return rv
-
-        rv = None
-        if "=" in inp:
-            rv = parse_equality_based(inp)
-        elif in_str in inp:
-            if notin_str in inp:
-                try_log("notin not supported", is_warning=True)
-                return None
-            rv = parse_set_based(inp)
-        elif notin_str in inp:
-            if notin_str in inp:
-                try_log("notin not supported", is_warning=True)
-                return None
-        else:
-            rv = {}
-            only_keys = inp.split(",")
-            for key in only_keys:
-                parsed_key = parse_only_key(key)
-                if parsed_key is None:
+                    if len(s) == 1:
+                        s = s[0]
+                    rv[k] = s
+                except Exception:
+                    try_log(
+                        f"{set_str} is an invalid format use 'key in"
+                        " (value1,value2)' or only 'key'",
+                        is_warning=True,
+                    )
                     return None
-                rv.update(parsed_key)
+            else:
+                only_key = parse_only_key(set_str)
+                if not only_key:
+                    try_log(
+                        f"{set_str} is an invalid format use 'key in"
+                        " (value1,value2)' or only 'key'",
+                        is_warning=True,
+                    )
+                    return None
+                rv.update(only_key)
         if not rv:
             return None
         return rv
 
+    rv = None
+    # Each substring scan runs at most once, cheapest dispatch first
+    if "=" in inp:
+        rv = parse_equality_based(inp)
+    elif notin_str in inp:
+        try_log("notin not supported", is_warning=True)
+        return None
+    elif in_str in inp:
+        rv = parse_set_based(inp)
+    else:
+        rv = {}
+        only_keys = inp.split(",")
+        for key in only_keys:
+            parsed_key = parse_only_key(key)
+            if parsed_key is None:
+                return None
+            rv.update(parsed_key)
+    if not rv:
+        return None
+    return rv
+
+
+@functools.lru_cache(maxsize=256)
+def __parse_label_str_cached(inp: str) -> Tuple:
+    """Caches parsed label strings as immutable key/value pairs. Invalid
+    input raises ValueError so that it is not cached and the warnings are
+    logged on every call.
+    """
+    parsed = __parse_label_str(inp)
+    if not parsed:
+        raise ValueError(f"Invalid label input: {inp}")
+    return tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in parsed.items())
+
+
+def __label_str_to_dict(inp: str) -> Optional[Dict]:
+    try:
+        frozen = __parse_label_str_cached(inp)
+    except ValueError:
+        return None
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in frozen}
+
+
+def label_input_to_dict(input: Union[str, List[str], Dict]) -> Optional[Dict]:
     rv = {}
     if isinstance(input, str):
-        parsed = parse_str_input(input)
+        parsed = __label_str_to_dict(input)
         if not parsed:
             return None
         rv.update(parsed)
@@ -2062,7 +2108,7 @@ def label_input_to_dict(input: Union[str, List[str], Dict]) -> Optional[Dict]:
                     is_warning=True,
                 )
                 return None
-            parsed = parse_str_input(item)
+            parsed = __label_str_to_dict(item)
             if not parsed:
                 return None
             rv.update(parsed)
@@ -2079,7 +2125,8 @@ def label_input_to_dict(input: Union[str, List[str], Dict]) -> Optional[Dict]:
 
 
 def make_uuid():
-    return b64url(uuid4().bytes).decode("ascii").strip("=")
+    # 16 random bytes always encode to 22 characters plus "==" padding
+    return b64url(os.urandom(16))[:22].decode("ascii")
 
 
 def err_exit(message: str, exception: Exception = None):
@@ -2093,53 +2140,59 @@ def dict_raise_on_duplicates(ordered_pairs):
 
     source: https://stackoverflow.com/questions/14902299/json-loads-allows-duplicate-keys-in-a-dictionary-overwriting-the-first-value # noqa E501
     """
-    d = {}
-    for k, v in ordered_pairs:
-        if k in d:
-            raise ValueError(f"Duplicate {k!r} key found in JSON.")
-        else:
-            d[k] = v
+    d = dict(ordered_pairs)
+    if len(d) != len(ordered_pairs):
+        # Only walk the pairs in Python to name the duplicated key
+        seen = set()
+        for k, _ in ordered_pairs:
+            if k in seen:
+                raise ValueError(f"Duplicate {k!r} key found in JSON.")
+            seen.add(k)
     return d
 
 
-class UniqueKeyLoader(yaml.SafeLoader):
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_BASE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class UniqueKeyLoader(YAML_BASE_LOADER):
     def construct_mapping(self, node, deep=False):
-        mapping = set()
-        for key_node, value_node in node.value:
+        # Saved first because merge keys ("<<") rewrite node.value in super()
+        key_nodes = [key_node for key_node, _ in node.value]
+        has_merge = any(key_node.tag == YAML_MERGE_TAG for key_node in key_nodes)
+        mapping = super().construct_mapping(node, deep)
+        # Merged keys can make up the count lost to a duplicate, so only
+        # trust the size comparison when there is no merge key.
+        if not has_merge and len(mapping) == len(key_nodes):
+            return mapping
+        # Constructed keys are cached by the loader so this is cheap.
+        seen = set()
+        for key_node in key_nodes:
+            if key_node.tag == YAML_MERGE_TAG:
+                continue
             key = self.construct_object(key_node, deep=deep)
-            if key in mapping:
-                raise ValueError(f"Duplicate key {key!r} found in {self.name!r}.")
-            mapping.add(key)
-        return super().construct_mapping(node, deep)
+            if key in seen:
+                raise ValueError(
+                    f"Duplicate key {key!r} found in {node.start_mark.name!r}."
+                )
+            seen.add(key)
+        return mapping
 
 
 def load_resource_file(file: Union[str, IO], validate_cmd: bool = False):
-    try:
-        name, resrc_data = __load_yaml_file(file)
-    except ValueError as e:
-        if validate_cmd:
-            try_log(" ".join(e.args))
-            sys.exit(0)
-        err_exit(" ".join(e.args))
-    except Exception as e:
-        if isinstance(file, io.TextIOWrapper):
-            file.seek(0, 0)
-        if file.name.endswith(".yaml"):
-            err_exit("Error decoding yaml" + str(e.args))
+    file_name = file.name if isinstance(file, io.TextIOWrapper) else str(file)
+    if file_name.endswith(".json"):
+        # The json parser is much faster than yaml, try it first
         try:
             name, resrc_data = __load_json_file(file)
-        except json.JSONDecodeError as e:
-            if validate_cmd:
-                try_log("Error decoding json" + " ".join(e.args))
-                sys.exit(0)
-            err_exit("Error decoding json" + " ".join(e.args))
-        except ValueError as e:
-            if validate_cmd:
-                try_log(" ".join(e.args))
-                sys.exit(0)
-            err_exit(" ".join(e.args))
         except Exception:
-            err_exit("Unable to load resource file.")
+            # yaml content or a duplicate key, the yaml path loads or names it
+            if isinstance(file, io.TextIOWrapper):
+                file.seek(0, 0)
+            name, resrc_data = __load_yaml_resource(file, file_name, validate_cmd)
+    else:
+        name, resrc_data = __load_yaml_resource(file, file_name, validate_cmd)
     __validate_data_structure_on_load(resrc_data, validate_cmd)
     if isinstance(resrc_data, dict):
         __validate_resource_on_load(resrc_data, name, validate_cmd)
@@ -2151,6 +2204,41 @@ def load_resource_file(file: Union[str, IO], validate_cmd: bool = False):
     return resrc_data
 
 
+def __load_yaml_resource(
+    file: Union[str, IO], file_name: str, validate_cmd=False
+) -> Tuple[str, Any]:
+    try:
+        return __load_yaml_file(file)
+    except ValueError as e:
+        if validate_cmd:
+            try_log(" ".join(e.args))
+            sys.exit(0)
+        err_exit(" ".join(e.args))
+    except Exception as e:
+        if isinstance(file, io.TextIOWrapper):
+            file.seek(0, 0)
+        if file_name.endswith(".yaml"):
+            err_exit("Error decoding yaml" + str(e.args))
+        return __load_json_resource(file, validate_cmd)
+
+
+def __load_json_resource(file: Union[str, IO], validate_cmd=False) -> Tuple[str, Any]:
+    try:
+        return __load_json_file(file)
+    except json.JSONDecodeError as e:
+        if validate_cmd:
+            try_log("Error decoding json" + " ".join(e.args))
+            sys.exit(0)
+        err_exit("Error decoding json" + " ".join(e.args))
+    except ValueError as e:
+        if validate_cmd:
+            try_log(" ".join(e.args))
+            sys.exit(0)
+        err_exit(" ".join(e.args))
+    except Exception:
+        err_exit("Unable to load resource file.")
+
+
 def __validate_data_structure_on_load(resrc_data: Any, validate_cmd=False):
     if not isinstance(resrc_data, dict) and not isinstance(resrc_data, list):
         if validate_cmd:
@@ -2214,23 +2302,36 @@ def dictionary_mod(fn) -> Dict:
     return wrapper
 
 
+@functools.lru_cache(maxsize=4096)
+def __parse_zulu(time_value):
+    # Tables often repeat the same timestamps, parse each one once
+    import zulu
+
+    return zulu.Zulu.parse(time_value)
+
+
+@functools.lru_cache(maxsize=4096)
+def __format_epoch(epoch) -> str:
+    dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S") + " UTC"
+
+
 def to_timestamp(zulu_str):
     try:
-        return zulu.Zulu.parse(zulu_str).timestamp()
+        return __parse_zulu(zulu_str).timestamp()
     except Exception:
         return zulu_str
 
 
 def epoch_to_zulu(epoch):
     try:
-        return zulu.Zulu.fromtimestamp(epoch).format("YYYY-MM-ddTHH:mm:ss") + " UTC"
+        return __format_epoch(epoch)
     except Exception:
         return epoch
 
 
 def truncate_hour_epoch(input_epoch: float) -> float:
-    rv = input_epoch - (input_epoch % 3600)
-    return rv
+    return input_epoch - input_epoch % 3600
 
 
 def get_metadata_name(resource: Dict) -> Optional[str]:
@@ -2245,6 +2346,10 @@ def get_metadata_type(resource: Dict) -> Optional[str]:
     return type
 
 
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+
 def slugify(value, allow_unicode=False):
     """
     Taken from https://github.com/django/django/blob/master/django/utils/text.py  # noqa E501
@@ -2254,7 +2359,10 @@ def slugify(value, allow_unicode=False):
     trailing whitespace, dashes, and underscores.
     """
     value = str(value)
-    if allow_unicode:
+    if value.isascii():
+        # Normalization leaves ASCII text unchanged
+        pass
+    elif allow_unicode:
         value = unicodedata.normalize("NFKC", value)
     else:
         value = (
@@ -2262,8 +2370,8 @@ def slugify(value, allow_unicode=False):
             .encode("ascii", "ignore")
             .decode("ascii")
         )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-_")
+    value = SLUG_STRIP_RE.sub("", value.lower())
+    return SLUG_DASH_RE.sub("-", value).strip("-_")
 
 
 FILE_EXT_MAP = {
@@ -2302,11 +2410,12 @@ def unique_fn(fn: str, output_format) -> Optional[str]:
     count = 1
     file_ext = FILE_EXT_MAP[output_format]
     try:
-        filepath = Path(fn + file_ext)
+        # List the directory once rather than stat'ing every candidate name
+        parent = os.path.dirname(fn) or "."
+        existing = set(os.listdir(parent)) if os.path.isdir(parent) else set()
         new_fn = fn
-        while filepath.exists():
+        while os.path.basename(new_fn) + file_ext in existing:
             new_fn = fn + f"_{count}"
-            filepath = Path(new_fn + file_ext)
             count += 1
     except Exception:
         try_log(f"Unable to build unique filename for {fn}", is_warning=True)
@@ -2315,25 +2424,25 @@ def unique_fn(fn: str, output_format) -> Optional[str]:
 
 
 def make_checksum(dictionary: Dict) -> str:
-    # Convert dictionary to JSON string with sorted keys
+    # Convert dictionary to JSON string with sorted keys. json.dumps escapes
+    # non-ASCII characters so the string can be encoded as ASCII directly.
     json_str = json.dumps(dictionary, sort_keys=True, separators=(",", ":"))
 
-    # Create MD5 hash object
-    md5_hash = hashlib.md5()
-
-    # Update the hash object with the bytes of the JSON string
-    md5_hash.update(json_str.encode("utf-8"))
+    # MD5 is kept so checksums stay comparable with existing ones. It is a
+    # content fingerprint, not a security control.
+    md5_hash = hashlib.md5(json_str.encode("ascii"), usedforsecurity=False)
 
     # Get the hexadecimal representation of the hash
     return md5_hash.hexdigest()
 
 
+GLOB_TO_REGEX_TABLE = str.maketrans(
+    {".": "\\.", "^": "\\^", "$": "\\$", "*": ".*", "?": "."}
+)
+
+
 def simple_glob_to_regex(input_str: str):
-    rv = input_str.replace(".", "\\.")
-    rv = rv.replace("^", "\\^")
-    rv = rv.replace("$", "\\$")
-    rv = rv.replace("*", ".*")
-    rv = rv.replace("?", ".")
+    rv = input_str.translate(GLOB_TO_REGEX_TABLE)
     rv = f"^{rv}$"
     return rv
 
@@ -2387,12 +2496,21 @@ def is_public_dns(hostname: str) -> bool:
 
 
 def is_redirected() -> bool:
-    return os.fstat(0) != os.fstat(1)
+    # stdin and stdout differ when one is redirected; compare file identity
+    # only, the full stat results also include timestamps
+    stdin_stat, stdout_stat = os.fstat(0), os.fstat(1)
+    return (stdin_stat.st_dev, stdin_stat.st_ino) != (
+        stdout_stat.st_dev,
+        stdout_stat.st_ino,
+    )
 
 
 def calc_age(time_float: float):
-    creation_timestamp = zulu.parse(time_float)
-    age_delta = zulu.now() - creation_timestamp
+    if isinstance(time_float, (int, float)):
+        # Epoch input needs no parsing, plain arithmetic is enough
+        age_delta = timedelta(seconds=time.time() - time_float)
+    else:
+        age_delta = datetime.now(timezone.utc) - __parse_zulu(time_float)
     if age_delta.days > 0:
         age = f"{age_delta.days}d"
         return age
@@ -2404,19 +2522,17 @@ def calc_age(time_float: float):
         return age
 
 
+# (unit length in seconds, suffix), largest unit first
+DURATION_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
+
+
 def convert_to_duration(seconds: float) -> str:
-    if seconds >= 86400:
-        return f"{int(seconds // 86400)}d"
-    elif seconds >= 3600:
-        return f"{int(seconds // 3600)}h"
-    elif seconds >= 60:
-        return f"{int(seconds // 60)}m"
-    elif seconds >= 1:
-        return f"{int(seconds)}s"
-    elif seconds > 0:
+    for unit_seconds, suffix in DURATION_UNITS:
+        if seconds >= unit_seconds:
+            return f"{int(seconds // unit_seconds)}{suffix}"
+    if seconds > 0:
         return f"{int(seconds * 1000)}ms"
-    else:
-        return "0s"
+    return "0s"
 
 
 TGT_NAME_VALID_SYMBOLS = ["-", "_"]
@@ -2431,24 +2547,27 @@ TGT_NAME_ERROR_MSG = (
 NOTIF_CONF_NAME_ERROR_MSG = "Name must be less than 64 characters."
 
 
-def is_valid_tgt_name(input_string):
-    pattern = r"^[a-zA-Z0-9\-_]+$"
+# Letters, numbers, dashes and underscores, at most 64 characters
+VALID_NAME_RE = re.compile(r"[a-zA-Z0-9\-_]{1,64}")
+VALID_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
 
-    if re.match(pattern, input_string) and len(input_string) <= 64:
-        return True
-    else:
-        return False
 
+def is_valid_name(input_string) -> bool:
+    """Shared check for target and notification names."""
+    return VALID_NAME_RE.fullmatch(input_string) is not None
+
+
+is_valid_tgt_name = is_valid_name
 
-def is_valid_notification_name(input_string) -> str:
-    if len(input_string) <= 64:
-        return True
-    return False
+
+def is_valid_notification_name(input_string) -> bool:
+    # Notification configuration names only have a length limit
+    # (see NOTIF_CONF_NAME_ERROR_MSG)
+    return len(input_string) <= 64
 
 
 def valid_notification_name(input_string) -> str:
-    pattern = r"^[a-zA-Z0-9\-_]+$"
-    if re.match(pattern, input_string) and len(input_string) <= 64:
+    if is_valid_name(input_string):
         return input_string
     raise click.UsageError(
         "Notification name must contain only letters, numbers, and"
@@ -2464,14 +2583,7 @@ def valid_schema(input_string) -> str:
 
 
 def is_valid_email(email):
-    # Define a regular expression pattern for a valid email address
-    pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
-
-    # Use the re.match function to check if the email matches the pattern
-    if re.match(pattern, email):
-        return True
-    else:
-        return False
+    return VALID_EMAIL_RE.match(email) is not None
 
 
 def is_valid_url(url):
@@ -2506,7 +2618,7 @@ def is_valid_slack_url(url: str):
 
 def encode_int(x, length=4):
     b = int(x).to_bytes(length, byteorder="big")
-    return b64url(b).decode("ascii").strip("=")
+    return b64url(b).rstrip(b"=").decode("ascii")
 
 
 def build_ctx() -> str:
@@ -2533,13 +2645,15 @@ def limit_line_length(s: str, max_length: int = 50) -> str:
     Returns:
         str: The modified string with limited line length.
     """
-    lines = s.split("\n")
     new_lines = []
-    for line in lines:
-        while len(line) > max_length:
-            new_lines.append(line[:max_length])
-            line = line[max_length:]
-        new_lines.append(line)
+    for line in s.split("\n"):
+        if len(line) <= max_length:
+            new_lines.append(line)
+        else:
+            # Slice by index so the remaining tail is never re-copied
+            new_lines.extend(
+                line[i : i + max_length] for i in range(0, len(line), max_length)
+            )
     return "\n".join(new_lines)
 
 
@@ -2680,31 +2794,54 @@ VARIANT_TO_OP = {
     NOT_IN_SUBNET_VARIANT: "<<",
 }
 
+# Clause templates for option variants that wrap or decorate the value,
+# with the variant's operator resolved once at import. Variants not listed
+# here compare the field directly to the query value.
+VARIANT_TO_CLAUSE_FMT = {
+    variant: clause_fmt.replace("{op}", VARIANT_TO_OP[variant])
+    for variant, clause_fmt in (
+        (NOT_CONTAINS_VARIANT, "NOT {field} {op} '*{value}*'"),
+        (STARTS_WITH_VARIANT, "{field} {op} '{value}*'"),
+        (ENDS_WITH_VARIANT, "{field} {op} '*{value}'"),
+        (CONTAINS_VARIANT, "{field} {op} '*{value}*'"),
+        (ANY_ITEM_EQUALS_VARIANT, "{field}[*] {op} '{value}'"),
+        (ANY_ITEM_CONTAINS_VARIANT, "{field}[*] {op} '*{value}*'"),
+        (ALL_ITEMS_NOT_EQUALS_VARIANT, "NOT {field}[*] {op} '{value}'"),
+        (ALL_ITEMS_NOT_CONTAINS_VARIANT, "NOT {field}[*] {op} '*{value}*'"),
+        (ANY_KEY_EQUALS_VARIANT, "{field}:keys[*] {op} '{value}'"),
+        (ANY_KEY_CONTAINS_VARIANT, "{field}:keys[*] {op} '*{value}*'"),
+        (ANY_VALUE_EQUALS_VARIANT, "{field}:vals[*] {op} '{value}'"),
+        (ANY_VALUE_CONTAINS_VARIANT, "{field}:vals[*] {op} '*{value}*'"),
+        (IN_SUBNET_VARIANT, "{field} {op} '{value}'"),
+        (NOT_IN_SUBNET_VARIANT, "NOT {field} {op} '{value}'"),
+    )
+}
+
 NAME_OR_UID_FIELDS = {
-    "event_deviation": ["policy_name", "policy_uid"],
-    "event_fingerprint": [
+    "event_deviation": ("policy_name", "policy_uid"),
+    "event_fingerprint": (
         "image",
         "image_id",
         "container_name",
         "container_id",
         "service_name",
-    ],
-    "event_opsflag": ["short_name"],
-    "event_redflag": ["short_name"],
-    # "model_agent": ["hostname"], filtering done elsewhere
-    "model_bundled_connection": [],
-    "model_container": ["image", "image_id", "container_name", "container_id"],
-    "model_k8s_clusterrole": ["metadata.name", "metadata.uid"],
-    "model_k8s_clusterrolebinding": ["metadata.name", "metadata.uid"],
-    "model_k8s_daemonset": ["metadata.name", "metadata.uid"],
-    "model_k8s_deployment": ["metadata.name", "metadata.uid"],
-    "model_k8s_namespace": ["metadata.name"],
-    "model_k8s_node": ["metadata.name", "metadata.uid"],
-    "model_k8s_pod": ["metadata.name", "metadata.uid"],
-    "model_k8s_replicaset": ["metadata.name", "metadata.uid"],
-    "model_k8s_role": ["metadata.name", "metadata.uid"],
-    "model_k8s_rolebinding": ["metadata.name", "metadata.uid"],
-    "model_machine": ["hostname"],
+    ),
+    "event_opsflag": ("short_name",),
+    "event_redflag": ("short_name",),
+    # "model_agent": ("hostname",), filtering done elsewhere
+    "model_bundled_connection": (),
+    "model_container": ("image", "image_id", "container_name", "container_id"),
+    "model_k8s_clusterrole": ("metadata.name", "metadata.uid"),
+    "model_k8s_clusterrolebinding": ("metadata.name", "metadata.uid"),
+    "model_k8s_daemonset": ("metadata.name", "metadata.uid"),
+    "model_k8s_deployment": ("metadata.name", "metadata.uid"),
+    "model_k8s_namespace": ("metadata.name",),
+    "model_k8s_node": ("metadata.name", "metadata.uid"),
+    "model_k8s_pod": ("metadata.name", "metadata.uid"),
+    "model_k8s_replicaset": ("metadata.name", "metadata.uid"),
+    "model_k8s_role": ("metadata.name", "metadata.uid"),
+    "model_k8s_rolebinding": ("metadata.name", "metadata.uid"),
+    "model_machine": ("hostname",),
 }
 
 
@@ -2718,8 +2855,8 @@ def query_builder(
             return f'"{value}"'
         return value
 
-    def prefix(q: str, or_clause: bool = False, first: bool = False):
-        if q:
+    def prefix(parts: List[str], or_clause: bool = False, first: bool = False):
+        if parts:
             if first and or_clause:
                 return ""
             if or_clause:
@@ -2728,15 +2865,15 @@ def query_builder(
         return ""
 
     def name_or_uid_clause(schema: str) -> str:
-        name_or_uid_fields = NAME_OR_UID_FIELDS.get(schema, [])
-        name_or_uid_fields.append("id")
+        name_or_uid_fields = (*NAME_OR_UID_FIELDS.get(schema, ()), "id")
         or_clauses = [f'{field} ~= "{name_or_uid}"' for field in name_or_uid_fields]
         return f" ({' OR '.join(or_clauses)})"
 
     schema_opts = BUILT_QUERY_OPTIONS[schema]
-    query = ""
+    # Accumulate fragments and join once at the end
+    parts: List[str] = []
     if name_or_uid:
-        query += name_or_uid_clause(schema)
+        parts.append(name_or_uid_clause(schema))
     for k, v_tup in filters.items():
         if k not in schema_opts or not v_tup:
             continue
@@ -2746,58 +2883,23 @@ def query_builder(
             v_tup = [v_tup]
         or_clause = False
         if len(v_tup) > 1:
-            query += " (" if query else "("
+            parts.append(" (" if parts else "(")
             or_clause = True
+        so: SchemaOption = schema_opts[k]
+        op = VARIANT_TO_OP[so.option_variant]
+        clause_fmt = VARIANT_TO_CLAUSE_FMT.get(so.option_variant)
         first = True
         for v in v_tup:
-            so: SchemaOption = schema_opts[k]
-            op = VARIANT_TO_OP[so.option_variant]
-            if so.option_variant == NOT_CONTAINS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}NOT {so.query_field} {op} '*{v}*'"
-            elif so.option_variant == STARTS_WITH_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}{so.query_field} {op} '{v}*'"
-                )
-            elif so.option_variant == ENDS_WITH_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}{so.query_field} {op} '*{v}'"
-                )
-            elif so.option_variant == CONTAINS_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}{so.query_field} {op} '*{v}*'"
-                )
-            elif so.option_variant == ANY_ITEM_EQUALS_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}{so.query_field}[*] {op} '{v}'"
-                )
-            elif so.option_variant == ANY_ITEM_CONTAINS_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}{so.query_field}[*] {op} '*{v}*'"
-                )
-            elif so.option_variant == ALL_ITEMS_NOT_EQUALS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}NOT {so.query_field}[*] {op} '{v}'"
-            elif so.option_variant == ALL_ITEMS_NOT_CONTAINS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}NOT {so.query_field}[*] {op} '*{v}*'"
-            elif so.option_variant == ANY_KEY_EQUALS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}{so.query_field}:keys[*] {op} '{v}'"
-            elif so.option_variant == ANY_KEY_CONTAINS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}{so.query_field}:keys[*] {op} '*{v}*'"
-            elif so.option_variant == ANY_VALUE_EQUALS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}{so.query_field}:vals[*] {op} '{v}'"
-            elif so.option_variant == ANY_VALUE_CONTAINS_VARIANT:
-                query += f"{prefix(query, or_clause, first)}{so.query_field}:vals[*] {op} '*{v}*'"
-            elif so.option_variant == IN_SUBNET_VARIANT:
-                query += f"{prefix(query, or_clause, first)}{so.query_field} {op} '{v}'"
-            elif so.option_variant == NOT_IN_SUBNET_VARIANT:
-                query += (
-                    f"{prefix(query, or_clause, first)}NOT {so.query_field} {op} '{v}'"
-                )
+            if clause_fmt:
+                clause = clause_fmt.format(field=so.query_field, value=v)
             else:
-                query += f"{prefix(query, or_clause, first)}{so.query_field} {op} {make_query_value(so, v)}"
+                clause = f"{so.query_field} {op} {make_query_value(so, v)}"
+            parts.append(prefix(parts, or_clause, first))
+            parts.append(clause)
             first = False
         if len(v_tup) > 1:
-            query += ")"
-    query = "*" if not query else query  # If no filters, return all
+            parts.append(")")
+    query = "".join(parts) or "*"  # If no filters, return all
     if show_hint:
         try_log(
             "Hint: Run the following command to retrieve the same data in a raw format\n"
@@ -0,0 +1,46 @@
+"""Shared fixtures for the API tests"""
+
+import json
+import types
+
+import pytest
+
+import spyctl.api.notification_targets
+import spyctl.api.notification_templates
+from spyctl.tests.helpers import API_FIXTURES_DIR, make_json_response, patch_http
+
+
+@pytest.fixture
+def nt_http(mocker):
+    """HTTP verbs of spyctl.api.notification_targets, patched."""
+    return patch_http(mocker, spyctl.api.notification_targets)
+
+
+@pytest.fixture
+def nt_tmpl_http(mocker):
+    """HTTP verbs of spyctl.api.notification_templates, patched."""
+    return patch_http(mocker, spyctl.api.notification_templates)
+
+
+@pytest.fixture
+def http_json(mocker):
+    """Patch an HTTP verb in an API module to answer with a JSON payload.
+
+    Usage: ``mock_get = http_json(spyctl.api.orgs, "get", payload)``
+    """
+
+    def _patch(module: types.ModuleType, verb: str, payload):
+        return mocker.patch.object(
+            module, verb, return_value=make_json_response(payload)
+        )
+
+    return _patch
+
+
+@pytest.fixture(scope="session")
+def nt_email_payload():
+    """GET response for an email notification target. Do not mutate."""
+    with open(
+        API_FIXTURES_DIR / "notification_target_email.json", encoding="utf-8"
+    ) as f:
+        return json.load(f)
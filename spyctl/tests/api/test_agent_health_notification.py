@@ -1,9 +1,10 @@
-import spyctl.api.agent_health as ah
+from unittest.mock import patch
 
+import spyctl.api.agent_health as ah
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID
 
-def test_get_agent_health_notification_settings(mocker):
-    mock_get = mocker.patch("spyctl.api.agent_health.get")
 
+def test_get_agent_health_notification_settings(http_json):
     mock_response = {
         "agent_health_notification_settings": {
             "apiVersion": "spyderbat/v1",
@@ -25,18 +26,14 @@ def test_get_agent_health_notification_settings(mocker):
         }
     }
 
-    # Set mock return value for .json()
-    mock_get.return_value.json.return_value = mock_response
+    http_json(ah, "get", mock_response)
 
     # Test args
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
     ahn_uid = "ahn:2OXXXXXXXXXXXXX"
 
     # Call the function
     result = ah.get_agent_health_notification_settings(
-        api_url, api_key, org_uid, ahn_uid
+        API_URL, API_KEY, ORG_UID, ahn_uid
     )
 
     # Assertions
@@ -44,11 +41,9 @@ def test_get_agent_health_notification_settings(mocker):
     assert "notification_settings" in result["spec"]
 
 
-def test_delete_agent_health_notification_settings(mocker):
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
+@patch("spyctl.api.agent_health.delete")
+def test_delete_agent_health_notification_settings(mock_delete):
     ahn_uid = "ahn:2OXXXXXXXXXXXXX"
 
-    mocker.patch("spyctl.api.agent_health.delete")
-    ah.delete_agent_health_notification_settings(api_url, api_key, org_uid, ahn_uid)
+    ah.delete_agent_health_notification_settings(API_URL, API_KEY, ORG_UID, ahn_uid)
+    assert mock_delete.call_count == 1
@@ -1,9 +1,10 @@
-import spyctl.api.custom_flags as cf
+from unittest.mock import patch
 
+import spyctl.api.custom_flags as cf
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID
 
-def test_get_custom_flag(mocker):
-    mock_get = mocker.patch("spyctl.api.custom_flags.get")
 
+def test_get_custom_flag(http_json):
     mock_response = {
         "custom_flag": {
             "apiVersion": "spyderbat/v1",
@@ -37,27 +38,21 @@ def test_get_custom_flag(mocker):
         }
     }
 
-    # Set mock return value for .json()
-    mock_get.return_value.json.return_value = mock_response
+    http_json(cf, "get", mock_response)
 
     # Test args
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
     cf_uid = "flag:rXXXXXXXXXXXXXXX"
 
     # Call the function
-    result = cf.get_custom_flag(api_url, api_key, org_uid, cf_uid)
+    result = cf.get_custom_flag(API_URL, API_KEY, ORG_UID, cf_uid)
 
     # Assertions
     assert result["metadata"]["name"] == "cronjob_flag_r"
 
 
-def test_delete_custom_flag(mocker):
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
+@patch("spyctl.api.custom_flags.delete")
+def test_delete_custom_flag(mock_delete):
     cf_uid = "flag:rXXXXXXXXXXXXXXX"
 
-    mocker.patch("spyctl.api.custom_flags.delete")
-    cf.delete_custom_flag(api_url, api_key, org_uid, cf_uid)
+    cf.delete_custom_flag(API_URL, API_KEY, ORG_UID, cf_uid)
+    assert mock_delete.call_count == 1
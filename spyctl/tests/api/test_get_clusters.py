@@ -1,9 +1,11 @@
 "Tests Get Clusters"
 
+import spyctl.api.clusters as clusters
 from spyctl.api.clusters import get_clusters
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID
 
 
-def test_get_clusters(mocker):
+def test_get_clusters(http_json):
     # This is the fake API response from .json()
     mock_response = [
         {
@@ -22,13 +24,9 @@ def test_get_clusters(mocker):
         }
     ]
 
-    # Mock the 'get' function inside spyctl.api.clusters
-    mock_get = mocker.patch("spyctl.api.clusters.get")
-    mock_get.return_value.json.return_value = mock_response
+    http_json(clusters, "get", mock_response)
 
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    result = get_clusters(api_url, api_key, "spyderbat")
+    result = get_clusters(API_URL, API_KEY, ORG_UID)
 
     # Assert that the data was processed correctly
     assert isinstance(result, list)
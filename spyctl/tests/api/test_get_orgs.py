@@ -1,22 +1,21 @@
 "Handle the test for get orgs"
 
+import spyctl.api.orgs as orgs
 from spyctl.api.orgs import get_orgs
+from spyctl.tests.helpers import API_KEY, API_URL
 
 
 # Test get Orgs.
-def test_get_orgs(mocker):
-    mock_get = mocker.patch("spyctl.api.orgs.get")
+def test_get_orgs(http_json):
     mock_response = [
         {"uid": "org1", "name": "Org One"},
         {"uid": "org2", "name": "Org Two"},
     ]
-    mock_get.return_value.json.return_value = mock_response
+    mock_get = http_json(orgs, "get", mock_response)
 
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uids, org_names = get_orgs(api_url, api_key)
+    org_uids, org_names = get_orgs(API_URL, API_KEY)
 
     # Assert
     assert org_uids == ["org1", "org2"]
     assert org_names == ["Org One", "Org Two"]
-    mock_get.assert_called_once_with(f"{api_url}/api/v1/org/", api_key)
+    mock_get.assert_called_once_with(f"{API_URL}/api/v1/org/", API_KEY)
@@ -1,15 +1,21 @@
-import zulu
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 from spyctl.api.sources import get_sources
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID, make_json_response
 
+# Sources older than AUTO_HIDE_TIME are filtered out, so stamp them "now"
+FAKE_TS = datetime.now(timezone.utc).isoformat()
 
-def test_get_sources(mocker):
+
+@patch("spyctl.api.sources.get")
+def test_get_sources(mock_get):
     # mock response for the source endpoint
     mock_sources_response = [
         {
             "uid": "mach:xxxxxxxxxx",
-            "last_data": str(zulu.now().isoformat()),
-            "last_stored_chunk_end_time": str(zulu.now().isoformat()),
+            "last_data": FAKE_TS,
+            "last_stored_chunk_end_time": FAKE_TS,
             "name": "integration-Node",
             "description": "xyz",
         }
@@ -24,21 +30,15 @@ def test_get_sources(mocker):
         }
     ]
 
-    mock_get = mocker.patch("spyctl.api.sources.get")
-
     # Create a side effect
     mock_get.side_effect = [
         # First call returns source JSON
-        type("Response", (), {"json": lambda: mock_sources_response}),
+        make_json_response(mock_sources_response),
         # Second call returns agent JSON
-        type("Response", (), {"json": lambda: mock_agents_response}),
+        make_json_response(mock_agents_response),
     ]
 
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
-
-    result = get_sources(api_url, api_key, org_uid)
+    result = get_sources(API_URL, API_KEY, ORG_UID)
 
     # Assert
     assert isinstance(result, list)
@@ -1,246 +1,179 @@
-import spyctl.api.notification_targets as nt
+from unittest.mock import call
 
+import pytest
+
+import spyctl.api.notification_targets as nt
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID
 
-def test_get_notification_target(mocker):
-    mock_get = mocker.patch("spyctl.api.notification_targets.get")
-
-    mock_response = {
-        "notification_target": {
-            "apiVersion": "spyderbat/v1",
-            "kind": "NotificationTarget",
-            "metadata": {
-                "name": "Test-Target",
-                "description": "Test description",
-                "type": "email",
-                "uid": "ntgt:AuXXXXXXXXXXX",
-                "creationTimestamp": 1736181337,
-                "createdBy": "test@spyderbat.com",
-            },
-            "spec": {"emails": ["test406@gmail.com"]},
-        }
-    }
 
-    # Set mock return value for .json()
-    mock_get.return_value.json.return_value = mock_response
+def test_get_notification_target(nt_http, nt_email_payload):
+    nt_http.get.return_value.json.return_value = nt_email_payload
 
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
     nt_uid = "ntgt:AuXXXXXXXXXXX"
 
-    result = nt.get_notification_target(api_url, api_key, org_uid, nt_uid)
+    result = nt.get_notification_target(API_URL, API_KEY, ORG_UID, nt_uid)
 
     # Assert
     assert result["metadata"]["name"] == "Test-Target"
 
 
-def test_delete_notification_target(mocker):
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "spyderbat"
+def test_delete_notification_target(nt_http):
     nt_uid = "ntgt:AuXXXXXXXXXXX"
 
-    mocker.patch("spyctl.api.notification_targets.delete")
-    nt.delete_notification_target(api_url, api_key, org_uid, nt_uid)
-
-
-def test_create_email_notification_target(mocker):
-    mock_post = mocker.patch("spyctl.api.notification_targets.post")
-    mock_post.return_value.json.return_value = {"uid": "ntgt:1234abcd"}
-
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "org:abcd1234"
-    name = "test-email-target"
-
-    result = nt.create_email_notification_target(
-        api_url,
-        api_key,
-        org_uid,
-        name,
-        emails=["test@example.com"],
-        description="Test email target",
-        tags=["alert"],
-    )
-
-    assert result == "ntgt:1234abcd"
-    mock_post.assert_called_once_with(
-        f"{api_url}/api/v1/org/{org_uid}/notificationtarget/email/",
-        {
-            "name": name,
-            "emails": ["test@example.com"],
-            "description": "Test email target",
-            "tags": ["alert"],
-        },
-        api_key,
-    )
-
-
-def test_create_slack_notification_target(mocker):
-    mock_post = mocker.patch("spyctl.api.notification_targets.post")
-    mock_post.return_value.json.return_value = {"uid": "ntgt:slack5678"}
-
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "org:xyz987"
-    name = "test-slack-target"
-
-    result = nt.create_slack_notification_target(
-        api_url,
-        api_key,
-        org_uid,
-        name,
-        url="https://hooks.slack.com/test",
-        description="Test slack target",
-        tags=["slack", "team"],
-    )
-
-    assert result == "ntgt:slack5678"
-    mock_post.assert_called_once_with(
-        f"{api_url}/api/v1/org/{org_uid}/notificationtarget/slack/",
-        {
-            "name": name,
-            "url": "https://hooks.slack.com/test",
-            "description": "Test slack target",
-            "tags": ["slack", "team"],
-        },
-        api_key,
-    )
-
-
-def test_update_email_notification_target(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_targets.put")
-    mock_put.return_value.json.return_value = {
-        "notification_target": {"uid": "ntgt:email1234", "name": "Updated Email Target"}
-    }
-
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "org:abcd123"
-    ntgt_uid = "ntgt:email1234"
-
-    result = nt.update_email_notification_target(
-        api_url,
-        api_key,
-        org_uid,
-        ntgt_uid,
-        name="Updated Email Target",
-        emails=["updated@example.com"],
-        description="Updated description",
-        tags=["team1"],
-        clear_description=True,
-        clear_tags=True,
-    )
-
-    assert result["name"] == "Updated Email Target"
-    mock_put.assert_called_once_with(
-        f"{api_url}/api/v1/org/{org_uid}/notificationtarget/email/{ntgt_uid}",
-        {
-            "name": "Updated Email Target",
-            "emails": ["updated@example.com"],
-            "description": "Updated description",
-            "tags": ["team1"],
-        },
-        api_key,
-        {"clear_description": True, "clear_tags": True},
+    nt.delete_notification_target(API_URL, API_KEY, ORG_UID, nt_uid)
+
+
+@pytest.mark.parametrize(
+    "func,tgt_type,org_uid,tgt_uid,fields",
+    [
+        (
+            nt.create_email_notification_target,
+            "email",
+            "org:abcd1234",
+            "ntgt:1234abcd",
+            {
+                "emails": ["test@example.com"],
+                "description": "Test email target",
+                "tags": ["alert"],
+            },
+        ),
+        (
+            nt.create_slack_notification_target,
+            "slack",
+            "org:xyz987",
+            "ntgt:slack5678",
+            {
+                "url": "https://hooks.slack.com/test",
+                "description": "Test slack target",
+                "tags": ["slack", "team"],
+            },
+        ),
+    ],
+    ids=["email", "slack"],
+)
+def test_create_notification_target(nt_http, func, tgt_type, org_uid, tgt_uid, fields):
+    nt_http.post.return_value.json.return_value = {"uid": tgt_uid}
+
+    name = f"test-{tgt_type}-target"
+
+    result = func(API_URL, API_KEY, org_uid, name, **fields)
+
+    assert result == tgt_uid
+    nt_http.post.assert_called_once_with(
+        f"{API_URL}/api/v1/org/{org_uid}/notificationtarget/{tgt_type}/",
+        {"name": name, **fields},
+        API_KEY,
     )
 
 
-def test_update_slack_notification_target(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_targets.put")
-    mock_put.return_value.json.return_value = {
-        "notification_target": {"uid": "ntgt:slack5678", "name": "Updated Slack Target"}
+EMAIL_UPDATE_FIELDS = {
+    "name": "Updated Email Target",
+    "emails": ["updated@example.com"],
+    "description": "Updated description",
+    "tags": ["team1"],
+}
+EMAIL_UPDATE_FLAGS = {"clear_description": True, "clear_tags": True}
+EMAIL_UPDATE_CALL = call(
+    f"{API_URL}/api/v1/org/org:abcd123/notificationtarget/email/ntgt:email1234",
+    EMAIL_UPDATE_FIELDS,
+    API_KEY,
+    EMAIL_UPDATE_FLAGS,
+)
+
+SLACK_UPDATE_FIELDS = {
+    "name": "Updated Slack Target",
+    "url": "https://hooks.slack.com/updated",
+    "description": "Slack updated",
+    "tags": ["devops"],
+}
+SLACK_UPDATE_FLAGS = {"clear_description": False, "clear_tags": True}
+SLACK_UPDATE_CALL = call(
+    f"{API_URL}/api/v1/org/org:xyz987/notificationtarget/slack/ntgt:slack5678",
+    SLACK_UPDATE_FIELDS,
+    API_KEY,
+    SLACK_UPDATE_FLAGS,
+)
+
+
+@pytest.mark.parametrize(
+    "func,org_uid,tgt_uid,fields,clear_flags,expected_call",
+    [
+        (
+            nt.update_email_notification_target,
+            "org:abcd123",
+            "ntgt:email1234",
+            EMAIL_UPDATE_FIELDS,
+            EMAIL_UPDATE_FLAGS,
+            EMAIL_UPDATE_CALL,
+        ),
+        (
+            nt.update_slack_notification_target,
+            "org:xyz987",
+            "ntgt:slack5678",
+            SLACK_UPDATE_FIELDS,
+            SLACK_UPDATE_FLAGS,
+            SLACK_UPDATE_CALL,
+        ),
+    ],
+    ids=["email", "slack"],
+)
+def test_update_notification_target(
+    nt_http, func, org_uid, tgt_uid, fields, clear_flags, expected_call
+):
+    nt_http.put.return_value.json.return_value = {
+        "notification_target": {"uid": tgt_uid, "name": fields["name"]}
     }
 
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
-    org_uid = "org:xyz987"
-    ntgt_uid = "ntgt:slack5678"
-
-    result = nt.update_slack_notification_target(
-        api_url,
-        api_key,
-        org_uid,
-        ntgt_uid,
-        name="Updated Slack Target",
-        url="https://hooks.slack.com/updated",
-        description="Slack updated",
-        tags=["devops"],
-        clear_description=False,
-        clear_tags=True,
-    )
-
-    assert result["name"] == "Updated Slack Target"
-    mock_put.assert_called_once_with(
-        f"{api_url}/api/v1/org/{org_uid}/notificationtarget/slack/{ntgt_uid}",
-        {
-            "name": "Updated Slack Target",
-            "url": "https://hooks.slack.com/updated",
-            "description": "Slack updated",
-            "tags": ["devops"],
-        },
-        api_key,
-        {"clear_description": False, "clear_tags": True},
-    )
+    result = func(API_URL, API_KEY, org_uid, tgt_uid, **fields, **clear_flags)
 
+    assert result["name"] == fields["name"]
+    assert nt_http.put.call_args_list == [expected_call]
 
-def test_update_webhook_notification_target(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_targets.put")
-    mock_put.return_value.json.return_value = {
-        "notification_target": {
-            "uid": "nt:webhook123",
-            "name": "Updated Webhook Target",
-            "url": "https://example.com/hook",
-            "description": "Updated webhook description",
-            "tags": ["webhook", "notification"],
-        }
-    }
 
-    result = nt.update_webhook_notification_target(
-        "https://fake-url.com",
-        "fake-api-key",
-        "org:abcd",
-        "nt:webhook123",
-        name="Updated Webhook Target",
-        url="https://example.com/hook",
-        description="Updated webhook description",
-        tags=["webhook", "notification"],
-        clear_description=False,
-        clear_tags=False,
-    )
-
-    assert result["uid"] == "nt:webhook123"
-    assert result["name"] == "Updated Webhook Target"
-    assert result["url"] == "https://example.com/hook"
-    mock_put.assert_called_once()
-
-
-def test_update_pagerduty_notification_target(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_targets.put")
-    mock_put.return_value.json.return_value = {
-        "notification_target": {
-            "uid": "nt:pagerduty456",
-            "name": "Updated PagerDuty Target",
-            "routing_key": "new-routing-key",
-            "description": "Updated PagerDuty description",
-            "tags": ["pagerduty", "incident"],
-        }
+@pytest.mark.parametrize(
+    "func,tgt_uid,fields,clear_description",
+    [
+        (
+            nt.update_webhook_notification_target,
+            "nt:webhook123",
+            {
+                "name": "Updated Webhook Target",
+                "url": "https://example.com/hook",
+                "description": "Updated webhook description",
+                "tags": ["webhook", "notification"],
+            },
+            False,
+        ),
+        (
+            nt.update_pagerduty_notification_target,
+            "nt:pagerduty456",
+            {
+                "name": "Updated PagerDuty Target",
+                "routing_key": "new-routing-key",
+                "description": "Updated PagerDuty description",
+                "tags": ["pagerduty", "incident"],
+            },
+            True,
+        ),
+    ],
+    ids=["webhook", "pagerduty"],
+)
+def test_update_notification_target_response(
+    nt_http, func, tgt_uid, fields, clear_description
+):
+    nt_http.put.return_value.json.return_value = {
+        "notification_target": {"uid": tgt_uid, **fields}
     }
 
-    result = nt.update_pagerduty_notification_target(
-        "https://fake-url.com",
-        "fake-api-key",
+    result = func(
+        API_URL,
+        API_KEY,
         "org:abcd",
-        "nt:pagerduty456",
-        name="Updated PagerDuty Target",
-        routing_key="new-routing-key",
-        description="Updated PagerDuty description",
-        tags=["pagerduty", "incident"],
-        clear_description=True,
+        tgt_uid,
+        **fields,
+        clear_description=clear_description,
         clear_tags=False,
     )
 
-    assert result["uid"] == "nt:pagerduty456"
-    assert result["name"] == "Updated PagerDuty Target"
-    assert result["routing_key"] == "new-routing-key"
-    mock_put.assert_called_once()
+    assert result == {"uid": tgt_uid, **fields}
+    assert nt_http.put.call_count == 1
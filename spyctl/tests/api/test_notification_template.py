@@ -1,9 +1,14 @@
 import spyctl.api.notification_templates as nt
+from spyctl.tests.helpers import API_KEY, API_URL
 
+PD_CUSTOM_DETAILS = {"error_code": "500"}
+PD_TAGS = ["pagerduty", "alert"]
+SLACK_BLOCKS = [{"type": "section", "text": {"type": "mrkdwn", "text": "Alert"}}]
+SLACK_TAGS = ["slack", "incident"]
 
-def test_get_notification_template(mocker):
-    mock_get = mocker.patch("spyctl.api.notification_templates.get")
-    mock_get.return_value.json.return_value = {
+
+def test_get_notification_template(nt_tmpl_http):
+    nt_tmpl_http.get.return_value.json.return_value = {
         "notification_template": {
             "metadata": {"uid": "tmpl:MXXXXXXXXXXXXXX", "name": "test-tmpl"},
             "spec": {"body_text": "hello", "subject": "Spyderbat notification"},
@@ -11,7 +16,7 @@ def test_get_notification_template(mocker):
     }
 
     result = nt.get_notification_template(
-        "https://fake-url.com", "fake-api-key", "org:1234", "tmpl:MXXXXXXXXXXXXXX"
+        API_URL, API_KEY, "org:1234", "tmpl:MXXXXXXXXXXXXXX"
     )
 
     assert result["metadata"]["uid"] == "tmpl:MXXXXXXXXXXXXXX"
@@ -19,9 +24,8 @@ def test_get_notification_template(mocker):
     assert result["spec"]["body_text"] == "hello"
 
 
-def test_get_notification_templates(mocker):
-    mock_get = mocker.patch("spyctl.api.notification_templates.get")
-    mock_get.return_value.json.return_value = {
+def test_get_notification_templates(nt_tmpl_http):
+    nt_tmpl_http.get.return_value.json.return_value = {
         "notification_templates": [
             {"uid": "tmpl:1", "metadata": {"name": "Template 1"}},
             {"uid": "tmpl:2", "metadata": {"name": "Template 2"}},
@@ -29,22 +33,19 @@ def test_get_notification_templates(mocker):
         "total_pages": 1,
     }
 
-    templates, total_pages = nt.get_notification_templates(
-        "https://fake-url.com", "fake-api-key", "org:1234"
-    )
+    templates, total_pages = nt.get_notification_templates(API_URL, API_KEY, "org:1234")
 
     assert len(templates) == 2
     assert templates[0]["uid"] == "tmpl:1"
     assert total_pages == 1
 
 
-def test_create_email_notification_template(mocker):
-    mock_post = mocker.patch("spyctl.api.notification_templates.post")
-    mock_post.return_value.json.return_value = {"uid": "tmpl:created123"}
+def test_create_email_notification_template(nt_tmpl_http):
+    nt_tmpl_http.post.return_value.json.return_value = {"uid": "tmpl:created123"}
 
     result = nt.create_email_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:1234",
         name="Welcome Email",
         subject="Hello!",
@@ -54,12 +55,11 @@ def test_create_email_notification_template(mocker):
     )
 
     assert result == "tmpl:created123"
-    mock_post.assert_called_once()
+    assert nt_tmpl_http.post.call_count == 1
 
 
-def test_update_email_notification_template(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_templates.put")
-    mock_put.return_value.json.return_value = {
+def test_update_email_notification_template(nt_tmpl_http):
+    nt_tmpl_http.put.return_value.json.return_value = {
         "notification_template": {
             "metadata": {"uid": "tmpl:updated456", "name": "Updated Template"},
             "spec": {"subject": "Updated Subject", "body_text": "Updated body"},
@@ -67,8 +67,8 @@ def test_update_email_notification_template(mocker):
     }
 
     result = nt.update_email_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:1234",
         "tmpl:updated456",
         name="Updated Template",
@@ -80,16 +80,15 @@ def test_update_email_notification_template(mocker):
 
     assert result["metadata"]["uid"] == "tmpl:updated456"
     assert result["spec"]["subject"] == "Updated Subject"
-    mock_put.assert_called_once()
+    assert nt_tmpl_http.put.call_count == 1
 
 
-def test_create_pagerduty_notification_template(mocker):
-    mock_post = mocker.patch("spyctl.api.notification_templates.post")
-    mock_post.return_value.json.return_value = {"uid": "tmpl:pagerduty123"}
+def test_create_pagerduty_notification_template(nt_tmpl_http):
+    nt_tmpl_http.post.return_value.json.return_value = {"uid": "tmpl:pagerduty123"}
 
     result = nt.create_pagerduty_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:5678",
         name="PD Template",
         severity="critical",
@@ -97,19 +96,18 @@ def test_create_pagerduty_notification_template(mocker):
         class_="SystemAlert",
         source="host-1",
         component="cpu",
-        custom_details={"error_code": "500"},
+        custom_details=PD_CUSTOM_DETAILS,
         description="Template for PagerDuty alerts",
         group="infra",
-        tags=["pagerduty", "alert"],
+        tags=PD_TAGS,
     )
 
     assert result == "tmpl:pagerduty123"
-    mock_post.assert_called_once()
+    assert nt_tmpl_http.post.call_count == 1
 
 
-def test_update_pagerduty_notification_template(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_templates.put")
-    mock_put.return_value.json.return_value = {
+def test_update_pagerduty_notification_template(nt_tmpl_http):
+    nt_tmpl_http.put.return_value.json.return_value = {
         "notification_template": {
             "metadata": {"uid": "tmpl:pdupd456", "name": "Updated PD Template"},
             "spec": {
@@ -121,8 +119,8 @@ def test_update_pagerduty_notification_template(mocker):
     }
 
     result = nt.update_pagerduty_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:5678",
         "tmpl:pdupd456",
         name="Updated PD Template",
@@ -135,32 +133,30 @@ def test_update_pagerduty_notification_template(mocker):
 
     assert result["metadata"]["uid"] == "tmpl:pdupd456"
     assert result["spec"]["severity"] == "warning"
-    mock_put.assert_called_once()
+    assert nt_tmpl_http.put.call_count == 1
 
 
-def test_create_slack_notification_template(mocker):
-    mock_post = mocker.patch("spyctl.api.notification_templates.post")
-    mock_post.return_value.json.return_value = {"uid": "tmpl:slack123"}
+def test_create_slack_notification_template(nt_tmpl_http):
+    nt_tmpl_http.post.return_value.json.return_value = {"uid": "tmpl:slack123"}
 
     result = nt.create_slack_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:abcd",
         name="Slack Template",
         text="Incident occurred",
-        blocks=[{"type": "section", "text": {"type": "mrkdwn", "text": "Alert"}}],
+        blocks=SLACK_BLOCKS,
         channel="#alerts",
         description="Slack alert template",
-        tags=["slack", "incident"],
+        tags=SLACK_TAGS,
     )
 
     assert result == "tmpl:slack123"
-    mock_post.assert_called_once()
+    assert nt_tmpl_http.post.call_count == 1
 
 
-def test_update_slack_notification_template(mocker):
-    mock_put = mocker.patch("spyctl.api.notification_templates.put")
-    mock_put.return_value.json.return_value = {
+def test_update_slack_notification_template(nt_tmpl_http):
+    nt_tmpl_http.put.return_value.json.return_value = {
         "notification_template": {
             "metadata": {"uid": "tmpl:slack456", "name": "Updated Slack Template"},
             "spec": {
@@ -172,8 +168,8 @@ def test_update_slack_notification_template(mocker):
     }
 
     result = nt.update_slack_notification_template(
-        "https://fake-url.com",
-        "fake-api-key",
+        API_URL,
+        API_KEY,
         "org:abcd",
         "tmpl:slack456",
         name="Updated Slack Template",
@@ -186,4 +182,4 @@ def test_update_slack_notification_template(mocker):
 
     assert result["metadata"]["uid"] == "tmpl:slack456"
     assert result["spec"]["text"] == "Updated message"
-    mock_put.assert_called_once()
+    assert nt_tmpl_http.put.call_count == 1
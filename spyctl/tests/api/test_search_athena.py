@@ -2,26 +2,14 @@
 
 from unittest.mock import patch
 
-import pytest
-
 from spyctl.api import athena_search
+from spyctl.tests.helpers import make_json_response
 
 
-@pytest.fixture
-def sample_kwargs():
-    return {
-        "start_time": 1609459200,
-        "end_time": 1609462800,
-        "use_pbar": False,
-        "quiet": True,
-        "desc": "Test Search",
-    }
-
-
-@patch("spyctl.api.athena_search.post")
-@patch("spyctl.api.athena_search.cli.err_exit")
+@patch.object(athena_search, "post")
+@patch.object(athena_search.cli, "err_exit")
 def test_post_new_search_success(mock_err_exit, mock_post):
-    mock_post.return_value.json.return_value = {"id": "search_123"}
+    mock_post.return_value = make_json_response({"id": "search_123"})
     search_id = athena_search.post_new_search(
         "http://api.test",
         "apikey",
@@ -32,13 +20,13 @@ def test_post_new_search_success(mock_err_exit, mock_post):
         end_time=1,
     )
     assert search_id == "search_123"
-    mock_err_exit.assert_not_called()
+    assert not mock_err_exit.called
 
 
-@patch("spyctl.api.athena_search.post")
-@patch("spyctl.api.athena_search.cli.err_exit")
+@patch.object(athena_search, "post")
+@patch.object(athena_search.cli, "err_exit")
 def test_post_new_search_failure(mock_err_exit, mock_post):
-    mock_post.return_value.json.return_value = {"error": "Invalid schema"}
+    mock_post.return_value = make_json_response({"error": "Invalid schema"})
     athena_search.post_new_search(
         "http://api.test",
         "apikey",
@@ -51,29 +39,31 @@ def test_post_new_search_failure(mock_err_exit, mock_post):
     mock_err_exit.assert_called_once_with("Invalid schema")
 
 
-@patch("spyctl.api.athena_search.post")
-@patch("spyctl.api.athena_search.cli.err_exit")
+@patch.object(athena_search, "post")
+@patch.object(athena_search.cli, "err_exit")
 def test_retrieve_search_data_completed(mock_err_exit, mock_post):
-    mock_post.return_value.json.return_value = {
-        "results": [{"id": "obj1"}],
-        "token": None,
-        "result_count": 1,
-    }
+    mock_post.return_value = make_json_response(
+        {
+            "results": [{"id": "obj1"}],
+            "token": None,
+            "result_count": 1,
+        }
+    )
     results, token, count = athena_search.retrieve_search_data(
         "http://api.test", "apikey", "org123", "search_123", token=None
     )
     assert results == [{"id": "obj1"}]
     assert token is None
     assert count == 1
-    mock_err_exit.assert_not_called()
+    assert not mock_err_exit.called
 
 
-@patch("spyctl.api.athena_search.post")
-@patch("spyctl.api.athena_search.cli.err_exit")
+@patch.object(athena_search, "post")
+@patch.object(athena_search.cli, "err_exit")
 def test_validate_search_query_error(mock_err_exit, mock_post):
-    mock_post.return_value.json.return_value = {"ok": False, "error": "Invalid query"}
+    mock_post.return_value = make_json_response({"ok": False, "error": "Invalid query"})
     error_msg = athena_search.validate_search_query(
         "http://api.test", "apikey", "org123", "proc", "bad query"
     )
     assert error_msg == "Invalid query"
-    mock_err_exit.assert_not_called()
+    assert not mock_err_exit.called
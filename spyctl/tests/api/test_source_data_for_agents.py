@@ -1,12 +1,12 @@
 "Handle the test for Agents"
 
+import spyctl.api.agents as agents
 from spyctl.api.agents import get_sources_data_for_agents
+from spyctl.tests.helpers import API_KEY, API_URL, ORG_UID
 
 
 # Test get Orgs.
-def test_get_sources_data_for_agents(mocker):
-    mock_get = mocker.patch("spyctl.api.agents.get")
-
+def test_get_sources_data_for_agents(http_json):
     mock_agents_response = [
         {
             "muid": "mach:xxxxx",
@@ -28,11 +28,9 @@ def test_get_sources_data_for_agents(mocker):
         }
     ]
 
-    mock_get.return_value.json.return_value = mock_response
-    api_url = "https://fake-url.com"
-    api_key = "fake-api-key"
+    http_json(agents, "get", mock_response)
     agents_result, sources_map = get_sources_data_for_agents(
-        api_url, api_key, "spyderbat", mock_agents_response
+        API_URL, API_KEY, ORG_UID, mock_agents_response
     )
 
     # Assert
@@ -1,86 +1,85 @@
-from unittest.mock import patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT
+
+import pytest
 
 from spyctl.commands.apply_cmd.agent_health import (
     handle_apply_agent_health_notification,
 )
+from spyctl.tests.helpers import API_CONTEXT
 
-# Sample data (no UID)
-SAMPLE_CREATE_DATA = {
-    "metadata": {
-        "name": "test_name",
-        "description": "test_desc",
-    },
-    "spec": {
-        "scope_query": "test query",
-        "notification_settings": {"mock_setting": True},
-    },
-}
+# Sample data (no UID). Read-only, so tests cannot leak edits into each other.
+SAMPLE_CREATE_DATA = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "name": "test_name",
+                "description": "test_desc",
+            }
+        ),
+        "spec": MappingProxyType(
+            {
+                "scope_query": "test query",
+                "notification_settings": MappingProxyType({"mock_setting": True}),
+            }
+        ),
+    }
+)
 
 # Sample data for update (with UID)
-SAMPLE_UPDATE_DATA = {
-    "metadata": {
-        "uid": "ahn-1234",
-        "name": "test_name",
-        "description": "test_desc",
-    },
-    "spec": {
-        "scope_query": "test query",
-        "notification_settings": {"mock_setting": True},
-    },
-}
+SAMPLE_UPDATE_DATA = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "uid": "ahn-1234",
+                "name": "test_name",
+                "description": "test_desc",
+            }
+        ),
+        "spec": SAMPLE_CREATE_DATA["spec"],
+    }
+)
 
 
-@patch("spyctl.commands.apply_cmd.agent_health.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.agent_health.cli.try_log")
-@patch(
-    "spyctl.commands.apply_cmd.agent_health.post_new_agent_health_notification_settings"
-)
-def test_handle_apply_cmd_create(mock_post, mock_log, mock_ctx):
+@pytest.fixture
+def ah_mocks(mocker):
+    """Config, CLI and API dependencies of the apply handler, patched."""
+    mocks = SimpleNamespace(
+        **mocker.patch.multiple(
+            "spyctl.commands.apply_cmd.agent_health",
+            cfg=DEFAULT,
+            cli=DEFAULT,
+            post_new_agent_health_notification_settings=DEFAULT,
+            put_update_agent_health_notification_settings=DEFAULT,
+        )
+    )
+    mocks.cfg.get_current_context.return_value = API_CONTEXT
+    return mocks
+
+
+def test_handle_apply_cmd_create(ah_mocks):
     # Setup
-    mock_ctx.return_value.get_api_data.return_value = ("org", "key")
-    mock_post.return_value = "ahn:new"
+    ah_mocks.post_new_agent_health_notification_settings.return_value = "ahn:new"
 
     uid = handle_apply_agent_health_notification(SAMPLE_CREATE_DATA)
 
     # Assertions
-    mock_post.assert_called_once()
-    mock_log.assert_called_once_with(
+    ah_mocks.post_new_agent_health_notification_settings.assert_called_once()
+    ah_mocks.cli.try_log.assert_called_once_with(
         "Successfully created agent health notification ahn:new"
     )
     assert uid == "ahn:new"
 
 
-@patch("spyctl.commands.apply_cmd.agent_health.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.agent_health.cli.try_log")
-@patch(
-    "spyctl.commands.apply_cmd.agent_health.put_update_agent_health_notification_settings"
-)
-def test_handle_apply_cmd_update(mock_put, mock_log, mock_ctx):
-    mock_ctx.return_value.get_api_data.return_value = ("org", "key")
-
-    uid = handle_apply_agent_health_notification(SAMPLE_UPDATE_DATA)
-
-    # Assert
-    mock_put.assert_called_once()
-    mock_log.assert_called_once_with(
-        "Successfully created agent health notification ahn-1234"
+@pytest.mark.parametrize("from_edit,verb", [(False, "created"), (True, "edited")])
+def test_handle_apply_cmd_update(ah_mocks, from_edit, verb):
+    uid = handle_apply_agent_health_notification(
+        SAMPLE_UPDATE_DATA, from_edit=from_edit
     )
-    assert uid == "ahn-1234"
-
-
-@patch("spyctl.commands.apply_cmd.agent_health.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.agent_health.cli.try_log")
-@patch(
-    "spyctl.commands.apply_cmd.agent_health.put_update_agent_health_notification_settings"
-)
-def test_handle_apply_cmd_update_from_edit(mock_put, mock_log, mock_ctx):
-    mock_ctx.return_value.get_api_data.return_value = ("org", "key")
-
-    uid = handle_apply_agent_health_notification(SAMPLE_UPDATE_DATA, from_edit=True)
 
     # Assert
-    mock_put.assert_called_once()
-    mock_log.assert_called_once_with(
-        "Successfully edited agent health notification ahn-1234"
+    ah_mocks.put_update_agent_health_notification_settings.assert_called_once()
+    ah_mocks.cli.try_log.assert_called_once_with(
+        f"Successfully {verb} agent health notification ahn-1234"
     )
     assert uid == "ahn-1234"
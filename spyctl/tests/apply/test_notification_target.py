@@ -1,4 +1,7 @@
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import DEFAULT, patch
+
+import pytest
 
 from spyctl.commands.apply_cmd.notification_target import (
     handle_apply_email_notification_target,
@@ -7,151 +10,111 @@ from spyctl.commands.apply_cmd.notification_target import (
     handle_apply_webhook_notification_target,
 )
 
-# -------------------EMAIL------------------------
-
-
-# Sample email data
-sample_resrc_data = {
-    "metadata": {
-        "name": "email-target-1",
-        "description": "test description",
-        "tags": ["teamA", "critical"],
-    },
-    "spec": {"emails": ["alert@example.com"]},
-}
-
-
-@patch("spyctl.commands.apply_cmd.notification_target.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.notification_target.cli.try_log")
-@patch("spyctl.commands.apply_cmd.notification_target.create_email_notification_target")
-def test_handle_apply_email_notification_create(mock_create, mock_log, mock_ctx):
-    mock_ctx.return_value.get_api_data.return_value = ("org", "api_key")
-    mock_create.return_value = "email-uid-123"
-
-    uid = handle_apply_email_notification_target(sample_resrc_data)
-
-    # Assert
-    mock_create.assert_called_once_with(
-        "org",
-        "api_key",
-        name="email-target-1",
-        emails=["alert@example.com"],
-        description="test description",
-        tags=["teamA", "critical"],
-    )
-    mock_log.assert_called_once_with(
-        "Successfully created email notification target email-uid-123"
-    )
-    assert uid == "email-uid-123"
-
-
-# -------------------SLACK-------------------------
-
-
-sample_slack_resrc_data = {
-    "metadata": {
-        "name": "slack-target-1",
-        "description": "slack desc",
-        "tags": ["devops", "alerts"],
-    },
-    "spec": {"url": "https://hooks.slack.com/services/test"},
-}
-
-
-@patch("spyctl.commands.apply_cmd.notification_target.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.notification_target.cli.try_log")
-@patch("spyctl.commands.apply_cmd.notification_target.create_slack_notification_target")
-def test_handle_apply_slack_notification_create(mock_create, mock_log, mock_ctx):
-    # Setup
-    mock_ctx.return_value.get_api_data.return_value = ("org", "api_key")
-    mock_create.return_value = "slack-uid-456"
-
-    uid = handle_apply_slack_notification_target(sample_slack_resrc_data)
-
-    mock_create.assert_called_once_with(
-        "org",
-        "api_key",
-        name="slack-target-1",
-        url="https://hooks.slack.com/services/test",
-        description="slack desc",
-        tags=["devops", "alerts"],
-    )
-    mock_log.assert_called_once_with(
-        "Successfully created slack notification target slack-uid-456"
-    )
-    assert uid == "slack-uid-456"
-
-
-# -------------------WEBHOOK------------------------
-
-
-sample_webhook_resrc_data = {
-    "metadata": {
-        "name": "webhook-target-1",
-        "description": "webhook desc",
-        "tags": ["infra", "ops"],
-    },
-    "spec": {"url": "https://example.com/webhook"},
-}
-
-
-@patch("spyctl.commands.apply_cmd.notification_target.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.notification_target.cli.try_log")
-@patch(
-    "spyctl.commands.apply_cmd.notification_target.create_webhook_notification_target"
+# Sample resource data, one per target type. Read-only and shared by the
+# parametrized cases.
+EMAIL_SAMPLE = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "name": "email-target-1",
+                "description": "test description",
+                "tags": ["teamA", "critical"],
+            }
+        ),
+        "spec": MappingProxyType({"emails": ["alert@example.com"]}),
+    }
 )
-def test_handle_apply_webhook_notification_create(mock_create, mock_log, mock_ctx):
-    mock_ctx.return_value.get_api_data.return_value = ("org", "api_key")
-    mock_create.return_value = "webhook-uid-789"
-
-    uid = handle_apply_webhook_notification_target(sample_webhook_resrc_data)
 
-    mock_create.assert_called_once_with(
-        "org",
-        "api_key",
-        name="webhook-target-1",
-        url="https://example.com/webhook",
-        description="webhook desc",
-        tags=["infra", "ops"],
-    )
-    mock_log.assert_called_once_with(
-        "Successfully created webhook notification target webhook-uid-789"
-    )
-    assert uid == "webhook-uid-789"
-
-
-# -------------------PAGERDUTY-------------------------
-
-sample_pd_resrc_data = {
-    "metadata": {
-        "name": "pd-target-1",
-        "description": "pagerduty desc",
-        "tags": ["prod", "alerts"],
-    },
-    "spec": {"routing_key": "fake-routing-key"},
-}
+SLACK_SAMPLE = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "name": "slack-target-1",
+                "description": "slack desc",
+                "tags": ["devops", "alerts"],
+            }
+        ),
+        "spec": MappingProxyType({"url": "https://hooks.slack.com/services/test"}),
+    }
+)
 
+WEBHOOK_SAMPLE = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "name": "webhook-target-1",
+                "description": "webhook desc",
+                "tags": ["infra", "ops"],
+            }
+        ),
+        "spec": MappingProxyType({"url": "https://example.com/webhook"}),
+    }
+)
 
-@patch("spyctl.commands.apply_cmd.notification_target.cfg.get_current_context")
-@patch("spyctl.commands.apply_cmd.notification_target.cli.try_log")
-@patch(
-    "spyctl.commands.apply_cmd.notification_target.create_pagerduty_notification_target"
+PD_SAMPLE = MappingProxyType(
+    {
+        "metadata": MappingProxyType(
+            {
+                "name": "pd-target-1",
+                "description": "pagerduty desc",
+                "tags": ["prod", "alerts"],
+            }
+        ),
+        "spec": MappingProxyType({"routing_key": "fake-routing-key"}),
+    }
 )
-def test_handle_apply_pagerduty_notification_create(mock_create, mock_log, mock_ctx):
-    mock_ctx.return_value.get_api_data.return_value = ("org", "api_key")
-    mock_create.return_value = "pd-uid-321"
 
-    uid = handle_apply_pagerduty_notification_target(sample_pd_resrc_data)
 
-    mock_create.assert_called_once_with(
-        "org",
+@pytest.mark.parametrize(
+    "tgt_type,handler,data,uid",
+    [
+        (
+            "email",
+            handle_apply_email_notification_target,
+            EMAIL_SAMPLE,
+            "email-uid-123",
+        ),
+        (
+            "slack",
+            handle_apply_slack_notification_target,
+            SLACK_SAMPLE,
+            "slack-uid-456",
+        ),
+        (
+            "webhook",
+            handle_apply_webhook_notification_target,
+            WEBHOOK_SAMPLE,
+            "webhook-uid-789",
+        ),
+        (
+            "pagerduty",
+            handle_apply_pagerduty_notification_target,
+            PD_SAMPLE,
+            "pd-uid-321",
+        ),
+    ],
+    ids=["email", "slack", "webhook", "pagerduty"],
+)
+def test_handle_apply_notification_create(spyctl_api_ctx, tgt_type, handler, data, uid):
+    create_func = f"create_{tgt_type}_notification_target"
+    with patch.multiple(
+        "spyctl.commands.apply_cmd.notification_target",
+        cli=DEFAULT,
+        **{create_func: DEFAULT},
+    ) as mocks:
+        mocks[create_func].return_value = uid
+        assert handler(data) == uid
+
+    metadata = data["metadata"]
+    mocks[create_func].assert_called_once_with(
+        "api_url",
         "api_key",
-        name="pd-target-1",
-        routing_key="fake-routing-key",
-        description="pagerduty desc",
-        tags=["prod", "alerts"],
+        "org_uid",
+        name=metadata["name"],
+        description=metadata["description"],
+        tags=metadata["tags"],
+        **data["spec"],
     )
-    mock_log.assert_called_once_with(
-        "Successfully created pagerduty notification target pd-uid-321"
+    mocks["cli"].try_log.assert_called_once_with(
+        f"Successfully created {tgt_type} notification target {uid}"
     )
-    assert uid == "pd-uid-321"
@@ -1,80 +1,91 @@
 """Backup and restore the secrets file for testing purposes."""
 
 import os
-import shutil
 
 from click.testing import CliRunner
 
 from spyctl import spyctl
+from spyctl.config import configs, secrets
 
 
 class SetupException(Exception):
     pass
 
 
-CURRENT_CONTEXT = None
+SECRETS_SNAPSHOT = None
 
-
-def backup_context():
-    global CURRENT_CONTEXT
-    CURRENT_CONTEXT = current_context()
-    backup_secrets()
-
-
-def restore_context():
-    restore_secrets()
-    if CURRENT_CONTEXT:
-        use_current_context()
+SECRETS_PATH = os.path.join(os.path.expanduser("~"), ".spyctl/.secrets/secrets")
+SECRETS_BACKUP_PATH = SECRETS_PATH + ".bak"
 
 
 def backup_secrets():
-    home_dir = os.path.expanduser("~")
-    file_path = os.path.join(home_dir, ".spyctl/.secrets/secrets")
-    backup_path = os.path.join(home_dir, ".spyctl/.secrets/secrets.bak")
+    global SECRETS_SNAPSHOT
 
     # Check if the file exists
-    if not os.path.isfile(file_path):
-        print(f"File {file_path} does not exist.")
+    if not os.path.isfile(SECRETS_PATH):
+        print(f"File {SECRETS_PATH} does not exist.")
         return
 
-    # Backup the file
-    shutil.copyfile(file_path, backup_path)
-    print(f"File {file_path} has been backed up to {backup_path}.")
+    # Keep the contents in memory for restore_secrets(), and on disk in case
+    # the test run is killed before it can restore them
+    with open(SECRETS_PATH, "rb") as f:
+        SECRETS_SNAPSHOT = f.read()
+    with open(SECRETS_BACKUP_PATH, "wb") as f:
+        f.write(SECRETS_SNAPSHOT)
+    print(f"File {SECRETS_PATH} has been backed up to {SECRETS_BACKUP_PATH}.")
 
 
 def restore_secrets():
-    home_dir = os.path.expanduser("~")
-    file_path = os.path.join(home_dir, ".spyctl/.secrets/secrets")
-    backup_path = os.path.join(home_dir, ".spyctl/.secrets/secrets.bak")
-
-    # Check if the backup file exists
-    if not os.path.isfile(backup_path):
-        print(f"Backup file {backup_path} does not exist.")
+    global SECRETS_SNAPSHOT
+
+    if SECRETS_SNAPSHOT is not None:
+        with open(SECRETS_PATH, "wb") as f:
+            f.write(SECRETS_SNAPSHOT)
+        SECRETS_SNAPSHOT = None
+        # Remove the backup file
+        if os.path.isfile(SECRETS_BACKUP_PATH):
+            os.remove(SECRETS_BACKUP_PATH)
+    # Otherwise fall back to a backup left behind by a cancelled run. Moving
+    # it into place restores and removes it in one atomic step.
+    elif os.path.isfile(SECRETS_BACKUP_PATH):
+        os.replace(SECRETS_BACKUP_PATH, SECRETS_PATH)
+    else:
+        print(f"Backup file {SECRETS_BACKUP_PATH} does not exist.")
         return
 
-    # Restore the file
-    shutil.copyfile(backup_path, file_path)
-    print(f"File {file_path} has been restored from {backup_path}.")
-    # Remove the backup file
-    os.remove(backup_path)
+    print(f"File {SECRETS_PATH} has been restored from {SECRETS_BACKUP_PATH}.")
 
 
 def current_context():
-    runner = CliRunner()
-    result = runner.invoke(
-        spyctl.main,
-        [
-            "config",
-            "current-context",
-        ],
+    # Read the merged config in-process rather than invoking
+    # "spyctl config current-context" through the CLI. The loaded config
+    # and secrets are put back afterwards so later in-process CLI calls
+    # do not pick up state loaded here.
+    loaded = (
+        configs.LOADED_CONFIG,
+        configs.LOADED_CONFIGS,
+        configs.CURRENT_CONTEXT,
+        secrets.SECRETS,
     )
-    if result.exit_code != 0:
+    try:
+        configs.load_config(silent=True)
+        config = configs.get_loaded_config()
+    except (Exception, SystemExit) as e:
+        raise SetupException("Unable get current context") from e
+    finally:
+        (
+            configs.LOADED_CONFIG,
+            configs.LOADED_CONFIGS,
+            configs.CURRENT_CONTEXT,
+            secrets.SECRETS,
+        ) = loaded
+    if config is None:
         raise SetupException("Unable get current context")
-    current_ctx = result.output.strip("\n")
-    return current_ctx
+    if config.current_context == configs.CURR_CONTEXT_NONE:
+        return ""
+    return config.current_context or ""
 
 
-def use_current_context():
-    if CURRENT_CONTEXT:
-        runner = CliRunner()
-        runner.invoke(spyctl.main, ["config", "use-context", CURRENT_CONTEXT])
+def use_context(name: str):
+    runner = CliRunner()
+    runner.invoke(spyctl.main, ["config", "use-context", name])
@@ -0,0 +1,11 @@
+"""Shared setup for the spyctl test suite"""
+
+import pytest
+
+from spyctl.tests.helpers import API_CONTEXT, patch_current_context
+
+
+@pytest.fixture
+def spyctl_api_ctx(mocker):
+    """get_current_context() patched to return helpers.API_DATA."""
+    return patch_current_context(mocker, API_CONTEXT)
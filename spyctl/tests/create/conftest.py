@@ -0,0 +1,22 @@
+"""Shared fixtures for the create command tests"""
+
+import pytest
+
+from spyctl.commands.create import notification_target, notification_template
+from spyctl.tests.helpers import patch_create_cmd
+
+
+@pytest.fixture
+def nt_create_mocks(mocker, spyctl_api_ctx):
+    """Dependencies of the create notification-target commands, patched."""
+    return patch_create_cmd(
+        mocker, notification_target, "handle_apply_notification_target"
+    )
+
+
+@pytest.fixture
+def nt_tmpl_create_mocks(mocker, spyctl_api_ctx):
+    """Dependencies of the create notification-template commands, patched."""
+    return patch_create_cmd(
+        mocker, notification_template, "handle_apply_notification_template"
+    )
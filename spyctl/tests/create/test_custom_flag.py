@@ -3,16 +3,13 @@ from unittest.mock import patch
 from spyctl.commands.create.custom_flag import handle_create_custom_flag
 
 
-@patch("spyctl.config.configs.get_current_context")
 @patch("spyctl.commands.create.custom_flag.get_saved_query")
 @patch("spyctl.commands.create.custom_flag.cli.show")
 def test_create_custom_flag(
-    mock_current_context,
-    mock_get_saved_query,
     mock_cli_show,
+    mock_get_saved_query,
+    spyctl_api_ctx,
 ):
-    mock_current_context.return_value.get_api_data.return_value = ("org", "apikey")
-
     mock_get_saved_query.return_value = {
         "name": "Test Query",
         "query": "container.image = 'docker:latest'",
@@ -35,5 +32,7 @@ def test_create_custom_flag(
 
     handle_create_custom_flag("yaml", **kwargs)
 
-    mock_get_saved_query.assert_called_once_with("query:123")
+    mock_get_saved_query.assert_called_once_with(
+        "api_url", "api_key", "org_uid", "query:123"
+    )
     mock_cli_show.assert_called_once()
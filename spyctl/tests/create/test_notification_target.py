@@ -1,25 +1,14 @@
-from unittest.mock import patch
-
+import pytest
 from click.testing import CliRunner
 
+import spyctl.spyctl_lib as lib
 from spyctl.commands.create.notification_target import email, pagerduty, slack, webhook
 
 
-@patch("spyctl.cli.set_yes_option")
-@patch("spyctl.cli.show")
-@patch("spyctl.commands.create.notification_target.handle_apply_notification_target")
-@patch("spyctl.resources.notification_targets.data_to_yaml")
-@patch("spyctl.config.configs.get_current_context")
-def test_slack_command_basic(
-    mock_get_ctx, mock_data_to_yaml, mock_handle_apply, mock_show, mock_set_yes
-):
+def test_slack_command_cli(nt_create_mocks):
+    # Smoke test of argv parsing; the other commands are called directly
     runner = CliRunner()
 
-    # Setup mocks
-    mock_data_to_yaml.return_value = "mock_yaml"
-    mock_get_ctx.return_value.get_api_data.return_value = ("org", "apikey")
-
-    # Simulate CLI call
     result = runner.invoke(
         slack,
         [
@@ -32,114 +21,34 @@ def test_slack_command_basic(
         ],
     )
 
-    # Assertions
     assert result.exit_code == 0
-    mock_data_to_yaml.assert_called()
-    mock_show.assert_called_once_with("mock_yaml", "yaml")
-    mock_set_yes.assert_not_called()
-    mock_handle_apply.assert_not_called()
-
-
-@patch("spyctl.cli.set_yes_option")
-@patch("spyctl.cli.show")
-@patch("spyctl.commands.create.notification_target.handle_apply_notification_target")
-@patch("spyctl.resources.notification_targets.data_to_yaml")
-@patch("spyctl.config.configs.get_current_context")
-def test_email_command_basic(
-    mock_get_ctx, mock_data_to_yaml, mock_handle_apply, mock_show, mock_set_yes
-):
-    runner = CliRunner()
-
-    # Setup mocks
-    mock_data_to_yaml.return_value = "mock_yaml"
-    mock_get_ctx.return_value.get_api_data.return_value = ("org", "apikey")
-
-    # Simulate CLI call
-    result = runner.invoke(
-        email,
-        [
-            "--name",
-            "EmailTarget",
-            "--emails",
-            "test@spyderbat.com",
-            "--output",
-            "yaml",
-        ],
-    )
+    nt_create_mocks.show.assert_called_once_with("mock_yaml", "yaml")
+
+
+@pytest.mark.parametrize(
+    "cmd,kwargs",
+    [
+        (
+            slack,
+            {"name": "SlackTarget", "url": "https://hooks.slack.com/services/XYZ"},
+        ),
+        (email, {"name": "EmailTarget", "emails": ["test@spyderbat.com"]}),
+        (pagerduty, {"name": "PagerdutyTarget", "routing_key": "AAAXXXXXXXXXXXXXXX"}),
+        (
+            webhook,
+            {
+                "name": "WebhookTarget",
+                "url": "https://webhook.site/eba4e767-dc79-4e2a-b6bf-362280dd9de9",
+            },
+        ),
+    ],
+    ids=["slack", "email", "pagerduty", "webhook"],
+)
+def test_command_basic(nt_create_mocks, cmd, kwargs):
+    cmd.callback(output=lib.OUTPUT_YAML, apply=False, yes=False, **kwargs)
 
     # Assertions
-    assert result.exit_code == 0
-    mock_data_to_yaml.assert_called()
-    mock_show.assert_called_once_with("mock_yaml", "yaml")
-    mock_set_yes.assert_not_called()
-    mock_handle_apply.assert_not_called()
-
-
-@patch("spyctl.cli.set_yes_option")
-@patch("spyctl.cli.show")
-@patch("spyctl.commands.create.notification_target.handle_apply_notification_target")
-@patch("spyctl.resources.notification_targets.data_to_yaml")
-@patch("spyctl.config.configs.get_current_context")
-def test_pagerduty_command_basic(
-    mock_get_ctx, mock_data_to_yaml, mock_handle_apply, mock_show, mock_set_yes
-):
-    runner = CliRunner()
-
-    # Setup mocks
-    mock_data_to_yaml.return_value = "mock_yaml"
-    mock_get_ctx.return_value.get_api_data.return_value = ("org", "apikey")
-
-    # Simulate CLI call
-    result = runner.invoke(
-        pagerduty,
-        [
-            "--name",
-            "PagerdutyTarget",
-            "--routing-key",
-            "AAAXXXXXXXXXXXXXXX",
-            "--output",
-            "yaml",
-        ],
-    )
-
-    # Assertions
-    assert result.exit_code == 0
-    mock_data_to_yaml.assert_called()
-    mock_show.assert_called_once_with("mock_yaml", "yaml")
-    mock_set_yes.assert_not_called()
-    mock_handle_apply.assert_not_called()
-
-
-@patch("spyctl.cli.set_yes_option")
-@patch("spyctl.cli.show")
-@patch("spyctl.commands.create.notification_target.handle_apply_notification_target")
-@patch("spyctl.resources.notification_targets.data_to_yaml")
-@patch("spyctl.config.configs.get_current_context")
-def test_webhook_command_basic(
-    mock_get_ctx, mock_data_to_yaml, mock_handle_apply, mock_show, mock_set_yes
-):
-    runner = CliRunner()
-
-    # Setup mocks
-    mock_data_to_yaml.return_value = "mock_yaml"
-    mock_get_ctx.return_value.get_api_data.return_value = ("org", "apikey")
-
-    # Simulate CLI call
-    result = runner.invoke(
-        webhook,
-        [
-            "--name",
-            "WebhookTarget",
-            "--url",
-            "https://webhook.site/eba4e767-dc79-4e2a-b6bf-362280dd9de9",
-            "--output",
-            "yaml",
-        ],
-    )
-
-    # Assertions
-    assert result.exit_code == 0
-    mock_data_to_yaml.assert_called()
-    mock_show.assert_called_once_with("mock_yaml", "yaml")
-    mock_set_yes.assert_not_called()
-    mock_handle_apply.assert_not_called()
+    nt_create_mocks.data_to_yaml.assert_called()
+    nt_create_mocks.show.assert_called_once_with("mock_yaml", "yaml")
+    nt_create_mocks.set_yes.assert_not_called()
+    nt_create_mocks.handle_apply.assert_not_called()
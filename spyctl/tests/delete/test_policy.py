@@ -1,46 +1,39 @@
-import spyctl.commands.delete.policy as policy
-
+from types import MappingProxyType
+from unittest.mock import Mock
 
-def test_handle_delete_policy(mocker):
-    mock_ctx = mocker.MagicMock()
-    mock_ctx.get_api_data.return_value = ("api_url", "api_key", "org_uid")
-    mocker.patch(
-        "spyctl.commands.delete.policy.cfg.get_current_context",
-        return_value=mock_ctx,
-    )
+import spyctl.commands.delete.policy as policy
 
-    mocker.patch(
-        "spyctl.commands.delete.policy.get_policies",
-        return_value=(
-            {
-                "apiVersion": "spyderbat/v1",
-                "kind": "SpyderbatPolicy",
-                "metadata": {
-                    "createdBy": "test@spyderbat.com",
-                    "name": "test-policy",
-                    "type": "trace",
-                    "uid": "pol:AKFXXXX",
-                    "version": 1,
+# Read-only, the handler only reads its metadata
+POLICY = MappingProxyType(
+    {
+        "apiVersion": "spyderbat/v1",
+        "kind": "SpyderbatPolicy",
+        "metadata": {
+            "createdBy": "test@spyderbat.com",
+            "name": "test-policy",
+            "type": "trace",
+            "uid": "pol:AKFXXXX",
+            "version": 1,
+        },
+        "spec": {
+            "allowedFlags": [
+                {
+                    "class": "redflag/proc/command/high_severity/hidden/python",
+                    "display_name": "command_python",
+                    "display_severity": "high",
                 },
-                "spec": {
-                    "allowedFlags": [
-                        {
-                            "class": "redflag/proc/command/high_severity/hidden/python",
-                            "display_name": "command_python",
-                            "display_severity": "high",
-                        },
-                    ],
-                },
-            },
-        ),
-    )
+            ],
+        },
+    }
+)
+
 
-    mocker.patch(
-        "spyctl.commands.delete.policy.cli.query_yes_no",
-        return_value=True,
-    )
+def test_handle_delete_policy(monkeypatch, spyctl_api_ctx):
+    monkeypatch.setattr(policy, "get_policies", lambda *args, **kwargs: (POLICY,))
+    monkeypatch.setattr(policy.cli, "query_yes_no", lambda *args, **kwargs: True)
 
-    mock_delete = mocker.patch("spyctl.commands.delete.policy.delete_policy")
+    mock_delete = Mock()
+    monkeypatch.setattr(policy, "delete_policy", mock_delete)
 
     # call the actual function.
     policy.handle_delete_policy("test-policy")
@@ -1,33 +1,20 @@
-import spyctl.commands.delete.saved_query as saved_query
-
+from unittest.mock import Mock
 
-def test_handle_delete_saved_query(mocker):
-    mock_ctx = mocker.MagicMock()
-    mock_ctx.get_api_data.return_value = ("api_url", "api_key", "org_uid")
-    mocker.patch(
-        "spyctl.commands.delete.saved_query.cfg.get_current_context",
-        return_value=mock_ctx,
-    )
+import spyctl.commands.delete.saved_query as saved_query
 
-    mocker.patch(
-        "spyctl.commands.delete.saved_query.get_saved_queries",
-        return_value=(
-            [{"name": "saved-test-query", "uid": "sq123"}],
-            None,
-        ),
-    )
 
-    mocker.patch(
-        "spyctl.commands.delete.saved_query.cli.query_yes_no",
-        return_value=True,
+def test_handle_delete_saved_query(monkeypatch, spyctl_api_ctx):
+    saved_queries = ([{"name": "saved-test-query", "uid": "sq123"}], None)
+    monkeypatch.setattr(
+        saved_query, "get_saved_queries", lambda *args, **kwargs: saved_queries
     )
-
-    mocker.patch(
-        "spyctl.commands.delete.saved_query.get_saved_query_dependents",
-        return_value=None,
+    monkeypatch.setattr(saved_query.cli, "query_yes_no", lambda *args, **kwargs: True)
+    monkeypatch.setattr(
+        saved_query, "get_saved_query_dependents", lambda *args, **kwargs: None
     )
 
-    mock_delete = mocker.patch("spyctl.commands.delete.saved_query.delete_saved_query")
+    mock_delete = Mock()
+    monkeypatch.setattr(saved_query, "delete_saved_query", mock_delete)
 
     # call the actual function.
     saved_query.handle_delete_saved_query("saved-test-query")
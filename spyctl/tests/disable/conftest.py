@@ -0,0 +1,16 @@
+"""Shared fixtures for the disable command tests"""
+
+import pytest
+
+from spyctl.commands.disable import custom_flag
+from spyctl.tests.helpers import patch_cmd_output
+
+
+@pytest.fixture
+def disable_cf_mocks(mocker, monkeypatch, spyctl_api_ctx):
+    """Dependencies of the disable custom-flag command, patched."""
+    mocks = patch_cmd_output(mocker, monkeypatch, custom_flag, custom_flag.cli)
+    mocks.get_custom_flags = mocker.patch.object(custom_flag, "get_custom_flags")
+    mocks.put_disable = mocker.patch.object(custom_flag, "put_disable_custom_flag")
+    mocks.query_yes_no = mocker.patch.object(custom_flag.cli, "query_yes_no")
+    return mocks
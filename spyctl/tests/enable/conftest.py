@@ -0,0 +1,18 @@
+"""Shared fixtures for the enable notification command tests"""
+
+import pytest
+
+from spyctl.commands.notifications.enable import custom_flag, saved_query
+from spyctl.tests.helpers import patch_enable_cmd
+
+
+@pytest.fixture
+def enable_cf_mocks(mocker, monkeypatch, spyctl_api_ctx):
+    """Dependencies of the enable custom-flag command, patched."""
+    return patch_enable_cmd(mocker, monkeypatch, custom_flag, "get_custom_flags")
+
+
+@pytest.fixture
+def enable_sq_mocks(mocker, monkeypatch, spyctl_api_ctx):
+    """Dependencies of the enable saved-query command, patched."""
+    return patch_enable_cmd(mocker, monkeypatch, saved_query, "get_saved_queries")
@@ -1,65 +1,40 @@
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
 
-from click.testing import CliRunner
+import pytest
 
 from spyctl.commands.notifications.enable.custom_flag import enable_custom_flag
 
+# get_custom_flags() results, read-only
+FLAG_HIT = ((MappingProxyType({"uid": "flag:123", "name": "Test-Flag"}),), None)
+FLAG_MISS = ((), None)
 
-@patch("spyctl.commands.notifications.enable.custom_flag.lib.try_log")
-@patch(
-    "spyctl.commands.notifications.enable.custom_flag.put_enable_notification_settings"
-)
-@patch("spyctl.commands.notifications.enable.custom_flag.get_custom_flags")
-@patch("spyctl.commands.notifications.enable.custom_flag.cfg.get_current_context")
-def test_enable_custom_flag_success(
-    mock_get_context,
-    mock_get_custom_flags,
-    mock_put_enable_notifications,
-    mock_try_log,
-):
-    runner = CliRunner()
 
-    # Setup context and mock return values
-    mock_context = MagicMock()
-    mock_context.get_api_data.return_value = ("apikey", "orgid")
-    mock_get_context.return_value = mock_context
+def test_enable_custom_flag_success(enable_cf_mocks):
+    # Setup mock return values
+    enable_cf_mocks.lookup.return_value = FLAG_HIT
 
-    mock_get_custom_flags.return_value = (
-        [{"uid": "flag:123", "name": "Test-Flag"}],
-        None,
-    )
-
-    result = runner.invoke(enable_custom_flag, ["Test-Flag"])
+    enable_custom_flag.callback("Test-Flag")
 
-    assert result.exit_code == 0
-    mock_get_custom_flags.assert_called_once_with(
-        "apikey", "orgid", name_or_uid_contains="Test-Flag"
+    enable_cf_mocks.lookup.assert_called_once_with(
+        "api_url", "api_key", "org_uid", name_or_uid_contains="Test-Flag"
     )
-    mock_put_enable_notifications.assert_called_once_with(
-        "apikey",
-        "orgid",
+    enable_cf_mocks.put_enable.assert_called_once_with(
+        "api_url",
+        "api_key",
+        "org_uid",
         "flag:123",
     )
-    mock_try_log.assert_called_once_with(
-        "Notifications for custom flag 'Test-Flag' enabled"
-    )
+    assert enable_cf_mocks.logs == ["Notifications for custom flag 'Test-Flag' enabled"]
+    assert not enable_cf_mocks.err_exit.called
 
 
-@patch("spyctl.commands.notifications.enable.custom_flag.lib.err_exit")
-@patch("spyctl.commands.notifications.enable.custom_flag.get_custom_flags")
-@patch("spyctl.commands.notifications.enable.custom_flag.cfg.get_current_context")
-def test_enable_custom_flag_not_found(
-    mock_get_context,
-    mock_get_custom_flags,
-    mock_err_exit,
-):
-    mock_context = MagicMock()
-    mock_context.get_api_data.return_value = ("apikey", "orguid")
-    mock_get_context.return_value = mock_context
+def test_enable_custom_flag_not_found(enable_cf_mocks):
+    enable_cf_mocks.lookup.return_value = FLAG_MISS
+    enable_cf_mocks.err_exit.side_effect = SystemExit(1)
 
-    mock_get_custom_flags.return_value = ([], None)
+    with pytest.raises(SystemExit):
+        enable_custom_flag.callback("Missing-Flag")
 
-    runner = CliRunner()
-    runner.invoke(enable_custom_flag, ["Missing-Flag"])
-
-    mock_err_exit.assert_called_once_with(("Custom flag 'Missing-Flag' not found"))
+    enable_cf_mocks.err_exit.assert_called_once_with(
+        "Custom flag 'Missing-Flag' not found"
+    )
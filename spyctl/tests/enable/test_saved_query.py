@@ -1,55 +1,39 @@
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+
+import pytest
 
 from spyctl.commands.notifications.enable.saved_query import (
     enable_saved_query as enable_cmd,
 )
 
+# get_saved_queries() results
+SQ_HIT = ((MappingProxyType({"uid": "query:123"}),), None)
+SQ_MISS = ((), None)
 
-@patch("spyctl.commands.notifications.enable.saved_query.lib.try_log")
-@patch(
-    "spyctl.commands.notifications.enable.saved_query.put_enable_notification_settings"
-)
-@patch("spyctl.commands.notifications.enable.saved_query.get_saved_queries")
-@patch("spyctl.commands.notifications.enable.saved_query.cfg.get_current_context")
-def test_enable_saved_query_success(
-    mock_get_context,
-    mock_get_saved_queries,
-    mock_put_enable_notifications,
-    mock_try_log,
-):
-    mock_ctx = MagicMock()
-    mock_ctx.get_api_data.return_value = ("apikey", "orgid")
-    mock_get_context.return_value = mock_ctx
-
-    mock_get_saved_queries.return_value = ([{"uid": "query:123"}], None)
-
-    enable_cmd.callback("saved-query-name")
-
-    mock_get_saved_queries.assert_called_once_with(
-        "apikey", "orgid", name_or_uid_contains="saved-query-name"
-    )
-    mock_put_enable_notifications.assert_called_once_with(
-        "apikey", "orgid", "query:123"
+
+@pytest.mark.parametrize("name", ["saved-query-name", "Test-SavedQuery"])
+def test_enable_saved_query_success(enable_sq_mocks, name):
+    enable_sq_mocks.lookup.return_value = SQ_HIT
+
+    enable_cmd.callback(name)
+
+    enable_sq_mocks.lookup.assert_called_once_with(
+        "api_url", "api_key", "org_uid", name_or_uid_contains=name
     )
-    mock_try_log.assert_called_once_with(
-        "Notifications for saved query 'saved-query-name' enabled"
+    enable_sq_mocks.put_enable.assert_called_once_with(
+        "api_url", "api_key", "org_uid", "query:123"
     )
+    assert enable_sq_mocks.logs == [f"Notifications for saved query '{name}' enabled"]
+    assert not enable_sq_mocks.err_exit.called
 
 
-@patch("spyctl.commands.notifications.enable.saved_query.lib.err_exit")
-@patch("spyctl.commands.notifications.enable.saved_query.get_saved_queries")
-@patch("spyctl.commands.notifications.enable.saved_query.cfg.get_current_context")
-def test_enable_saved_query_not_found(
-    mock_get_context,
-    mock_get_saved_queries,
-    mock_err_exit,
-):
-    mock_ctx = MagicMock()
-    mock_ctx.get_api_data.return_value = ("apikey", "orgid")
-    mock_get_context.return_value = mock_ctx
+def test_enable_saved_query_not_found(enable_sq_mocks):
+    enable_sq_mocks.lookup.return_value = SQ_MISS
+    enable_sq_mocks.err_exit.side_effect = SystemExit(1)
 
-    mock_get_saved_queries.return_value = ([], None)
+    with pytest.raises(SystemExit):
+        enable_cmd.callback("missing-query")
 
-    enable_cmd.callback("missing-query")
-
-    mock_err_exit.assert_called_once_with("Saved query 'missing-query' not found")
+    enable_sq_mocks.err_exit.assert_called_once_with(
+        "Saved query 'missing-query' not found"
+    )
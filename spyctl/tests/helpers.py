@@ -0,0 +1,86 @@
+"""Constants and mock builders shared by the test packages.
+
+The conftest modules only hold fixtures, test modules import from here.
+"""
+
+import types
+from pathlib import Path
+
+from spyctl.config import configs
+
+# Same shape as Context.get_api_data()
+API_DATA = ("api_url", "api_key", "org_uid")
+
+# Arguments passed straight to the spyctl.api functions
+API_URL = "https://fake-url.com"
+API_KEY = "fake-api-key"
+ORG_UID = "spyderbat"
+
+API_FIXTURES_DIR = Path(__file__).parent / "api" / "fixtures"
+
+
+class FakeContext:
+    """Stand-in for a config Context that only serves API data."""
+
+    def __init__(self, api_data: tuple):
+        self.api_data = api_data
+
+    def get_api_data(self):
+        return self.api_data
+
+
+API_CONTEXT = FakeContext(API_DATA)
+
+
+def make_json_response(payload) -> types.SimpleNamespace:
+    """Stand-in HTTP response whose json() returns payload."""
+    return types.SimpleNamespace(json=lambda: payload)
+
+
+def patch_current_context(mocker, context: FakeContext):
+    return mocker.patch.object(configs, "get_current_context", return_value=context)
+
+
+def patch_http(mocker, module: types.ModuleType) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        get=mocker.patch.object(module, "get"),
+        post=mocker.patch.object(module, "post"),
+        put=mocker.patch.object(module, "put"),
+        delete=mocker.patch.object(module, "delete"),
+    )
+
+
+def patch_create_cmd(
+    mocker, module: types.ModuleType, handler: str
+) -> types.SimpleNamespace:
+    """Patch a create command module, its cli output and the data_to_yaml
+    of the resource module it imports as _nts."""
+    return types.SimpleNamespace(
+        set_yes=mocker.patch.object(module.cli, "set_yes_option"),
+        show=mocker.patch.object(module.cli, "show"),
+        handle_apply=mocker.patch.object(module, handler),
+        data_to_yaml=mocker.patch.object(
+            module._nts, "data_to_yaml", return_value="mock_yaml"
+        ),
+    )
+
+
+def patch_cmd_output(
+    mocker, monkeypatch, module: types.ModuleType, log_owner: types.ModuleType
+) -> types.SimpleNamespace:
+    """Record try_log messages from log_owner in logs and mock err_exit."""
+    logs = []
+    monkeypatch.setattr(log_owner, "try_log", logs.append)
+    return types.SimpleNamespace(
+        err_exit=mocker.patch.object(module.lib, "err_exit"),
+        logs=logs,
+    )
+
+
+def patch_enable_cmd(
+    mocker, monkeypatch, module: types.ModuleType, lookup: str
+) -> types.SimpleNamespace:
+    mocks = patch_cmd_output(mocker, monkeypatch, module, module.lib)
+    mocks.lookup = mocker.patch.object(module, lookup)
+    mocks.put_enable = mocker.patch.object(module, "put_enable_notification_settings")
+    return mocks
@@ -13,7 +13,9 @@ import spyctl.tests.mock_functions as mock_func
 from spyctl import spyctl
 from spyctl.config.configs import CURR_CONTEXT_NONE, set_testing
 from spyctl.spyctl_lib import time_inp
-from spyctl.tests.backups import backup_secrets, restore_secrets
+
+# Backs up and restores ~/.spyctl, so run on the single serial worker
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("spyctl_context_sandbox")]
 
 API_KEY = os.environ.get("API_KEY")
 API_URL = os.environ.get("API_URL")
@@ -509,8 +511,6 @@ def use_current_context():
 def setup_module():
     if not env_setup():
         raise SetupException("Check environment variables in pyproject.toml")
-    restore_secrets()  # In case the last test was cancelled
-    backup_secrets()
 
     global CURRENT_CONTEXT
     current_ctx = current_context()
@@ -537,4 +537,3 @@ def teardown_module():
     use_current_context()
     os.chdir(CURR_PATH)
     shutil.rmtree(WORKSPACE_PATH, ignore_errors=True)
-    restore_secrets()
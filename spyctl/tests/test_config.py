@@ -3,11 +3,14 @@ import shutil
 from fnmatch import fnmatch
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from spyctl import spyctl
 from spyctl.config.configs import CURR_CONTEXT_NONE, set_testing
-from spyctl.tests.backups import backup_secrets, restore_secrets
+
+# Backs up and restores ~/.spyctl, so run on the single serial worker
+pytestmark = [pytest.mark.serial, pytest.mark.usefixtures("spyctl_context_sandbox")]
 
 environ = dict(os.environ)
 API_KEY = os.environ.get("API_KEY")
@@ -487,8 +490,6 @@ def use_current_context():
 def setup_module():
     if not env_setup():
         raise SetupException("Check environment variables in pyproject.toml")
-    restore_secrets()  # In case the last test was cancelled
-    backup_secrets()
     global CURRENT_CONTEXT
     current_ctx = current_context()
     if current_ctx and current_ctx != CURR_CONTEXT_NONE:
@@ -511,4 +512,3 @@ def teardown_module():
     use_current_context()
     os.chdir(CURR_PATH)
     shutil.rmtree(WORKSPACE_PATH, ignore_errors=True)
-    restore_secrets()  # In case the last test was cancelled
@@ -2,6 +2,12 @@ import os
 import time
 from contextlib import redirect_stderr
 
+import click
+import pytest
+from click.testing import CliRunner
+
+import spyctl.cli as cli
+import spyctl.schemas_v2 as schemas_v2
 import spyctl.spyctl_lib as lib
 
 
@@ -63,6 +69,14 @@ def test_label_list_inp():
     assert result2 == test_output2
 
 
+def test_label_cached_inp():
+    test_str = "env in (stage, prod)"
+    result1 = lib.label_input_to_dict(test_str)
+    result1["env"].append("dev")
+    result2 = lib.label_input_to_dict(test_str)
+    assert result2 == {"env": ["stage", "prod"]}
+
+
 def test_label_dict_inp():
     test_dict = {"env": "stage", "tier": "frontend", "app": ["web", "db"]}
     result = lib.label_input_to_dict(test_dict)
@@ -110,3 +124,142 @@ def test_timeinp():
     capped_inp = lib.time_inp("09/16/2020", cap_one_day=True)
     one_day_ago = time.time() - 24 * 60 * 60
     assert abs(capped_inp - one_day_ago) < 1
+
+
+def test_query_builder(monkeypatch):
+    schema_opts = {
+        "image_contains": lib.SchemaOption(
+            lib.click.STRING, lib.CONTAINS_VARIANT, "image"
+        ),
+        "name_equals": lib.SchemaOption(lib.click.STRING, lib.EQUALS_VARIANT, "name"),
+        "pid_gt": lib.SchemaOption(lib.click.INT, lib.GREATER_THAN_VARIANT, "pid"),
+        "tags_not_contains": lib.SchemaOption(
+            lib.click.STRING, lib.ALL_ITEMS_NOT_CONTAINS_VARIANT, "tags"
+        ),
+    }
+    monkeypatch.setitem(lib.BUILT_QUERY_OPTIONS, "test_schema", schema_opts)
+    assert lib.query_builder("test_schema", show_hint=False) == "*"
+    query = lib.query_builder(
+        "test_schema",
+        show_hint=False,
+        image_contains=("nginx", "redis"),
+        name_equals="web",
+        pid_gt=("100",),
+        tags_not_contains="prod",
+        unknown="ignored",
+    )
+    assert query == (
+        "(image ~= '*nginx*' OR image ~= '*redis*')"
+        ' AND name = "web"'
+        " AND pid > 100"
+        " AND NOT tags[*] !~= '*prod*'"
+    )
+
+
+def test_query_builder_name_or_uid(monkeypatch):
+    monkeypatch.setitem(lib.BUILT_QUERY_OPTIONS, "model_machine", {})
+    expected = ' (hostname ~= "web-1" OR id ~= "web-1")'
+    for _ in range(2):
+        query = lib.query_builder("model_machine", "web-1", show_hint=False)
+        assert query == expected
+
+
+def test_get_dst_name():
+    assert lib.get_dst_name(lib.DST_TYPE_EMAIL) == lib.DST_NAME_EMAIL
+    assert lib.get_dst_name(lib.DST_TYPE_SLACK) == lib.DST_NAME_SLACK
+    assert lib.get_dst_name(lib.DST_TYPE_SNS) == lib.DST_NAME_SNS
+    assert lib.get_dst_name(lib.DST_TYPE_WEBHOOK) == lib.DST_NAME_WEBHOOK
+
+
+@pytest.mark.parametrize(
+    "file_name, parsers",
+    [
+        ("data.json", ["json"]),
+        ("data.yaml", ["yaml"]),
+        ("data.yml", ["yaml"]),
+        ("data.txt", ["json", "yaml"]),
+    ],
+)
+def test_load_file_parser_by_suffix(tmp_path, monkeypatch, file_name, parsers):
+    calls = []
+
+    def parser(name):
+        def parse(raw_data):
+            calls.append(name)
+            raise ValueError(name)
+
+        return parse
+
+    monkeypatch.setattr(lib, "__parse_json", parser("json"))
+    monkeypatch.setattr(lib, "__parse_yaml", parser("yaml"))
+    path = tmp_path / file_name
+    path.write_text('{"a": 1}')
+    assert lib.load_file(path) is None
+    assert calls == parsers
+
+
+def test_load_file_not_utf8(tmp_path):
+    path = tmp_path / "data.yaml"
+    path.write_bytes(b"a: \xff\xfe\n")
+    assert lib.load_file(path) is None
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--filename",
+    cls=lib.MutuallyExclusiveEatAll,
+    mutually_exclusive=["policy"],
+)
+@click.option("-p", "--policy")
+def eat_all_cmd(filename, policy):
+    click.echo(f"{filename} {policy}")
+
+
+def test_mutually_exclusive_eat_all():
+    runner = CliRunner()
+    result = runner.invoke(eat_all_cmd, ["-f", "a.yaml", "b.yaml"])
+    assert result.exit_code == 0
+    assert result.output == "('a.yaml', 'b.yaml') None\n"
+
+    result = runner.invoke(eat_all_cmd, ["-f", "a.yaml", "b.yaml", "-p", "pol"])
+    assert result.exit_code == 2
+    assert (
+        "Illegal usage: `filename` is mutually exclusive with arguments `policy`."
+        in result.output
+    )
+
+
+def test_load_resource_file_json_suffix(tmp_path, monkeypatch):
+    monkeypatch.setattr(schemas_v2, "valid_object", lambda data, verbose=True: True)
+    path = tmp_path / "resource.json"
+    path.write_text('{"kind": "Test", "spec": {}}')
+    assert lib.load_resource_file(str(path)) == {"kind": "Test", "spec": {}}
+    # yaml content in a .json file still loads
+    path.write_text("kind: Test\nspec: {}\n")
+    assert lib.load_resource_file(str(path)) == {"kind": "Test", "spec": {}}
+    # duplicate keys are reported against the file
+    path.write_text('{"kind": "Test", "kind": "Other"}')
+    with pytest.raises(SystemExit) as exc:
+        lib.load_resource_file(str(path))
+    assert "Duplicate key 'kind'" in str(exc.value)
+    assert str(path) in str(exc.value)
+
+
+def test_unique_key_loader_duplicate_with_merge():
+    data = "b: &b {x: 1, y: 2}\nc: {z: 1, z: 2, <<: *b}\n"
+    with pytest.raises(ValueError, match="Duplicate key 'z'"):
+        lib.yaml.load(data, lib.UniqueKeyLoader)
+    data = "b: &b {x: 1, y: 2}\nc: {z: 1, <<: *b}\n"
+    loaded = lib.yaml.load(data, lib.UniqueKeyLoader)
+    assert loaded["c"] == {"x": 1, "y": 2, "z": 1}
+
+
+def test_make_yaml():
+    assert cli.make_yaml("text") == "text\n...\n"
+    assert cli.make_yaml(5) == "5\n...\n"
+    data = {"b": 1, "a": [{"key": "env", "operator": "In", "values": ["x"]}]}
+    assert cli.make_yaml(data) == (
+        "b: 1\na:\n- {key: env, operator: In, values: [x]}\n"
+    )
+    assert cli.make_yaml(["one", {"x": 1}]) == "- one\n- x: 1\n"